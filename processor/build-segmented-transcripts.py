@@ -1,18 +1,20 @@
 from __future__ import annotations
 
 import json
-from collections import defaultdict
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List
 
-import regex
-
 from utils.cli_style import (
     INNER_DIVIDER,
     format_metadata_rows,
     format_preview_entry,
     print_warning,
 )
+from utils.parallel import run_logged
 
 """
 Build segment-level IPA transcript files `audio-{c}-{s}.txt` under
@@ -37,14 +39,29 @@ can be reviewed manually.
 """
 
 # Any remaining Han characters indicate the conversion failed.
-HAN_CHAR_PATTERN = regex.compile(r"\p{Han}")
+# Explicit CJK block ranges (radicals, iteration marks, unified ideographs and
+# their extensions, compatibility ideographs) approximate `\p{Han}` while
+# letting the stdlib `re` engine use a plain character-class scan.
+HAN_CHAR_PATTERN = re.compile(
+    "["
+    "\u2e80-\u2eff\u2f00-\u2fdf"
+    "\u3005\u3007\u3021-\u3029\u3038-\u303b"
+    "\u3400-\u4dbf\u4e00-\u9fff\uf900-\ufaff"
+    "\U00020000-\U0002fa1f\U00030000-\U0003347f"
+    "]"
+)
 
 
+# The same sentence IPA can recur across segments, so remember recent answers.
+@lru_cache(maxsize=8192)
 def contains_han_characters(value: str) -> bool:
     """Return True when the provided text includes any Chinese character."""
 
     if not value:
         return False
+    # IPA output is mostly ASCII; skip the regex scan entirely in that case.
+    if value.isascii():
+        return False
     return bool(HAN_CHAR_PATTERN.search(value))
 
 
@@ -66,9 +83,11 @@ def _segments_file_sort_key(path: Path) -> int:
         return 0
 
 
-def load_sentence_segments(root: Path) -> List[Dict[str, Any]]:
+def load_sentence_segments(root: Path) -> Dict[str, List[Dict[str, Any]]]:
     """
-    Load chapter segment JSON files from renderer/public/segments.
+    Load chapter segment JSON files from renderer/public/segments, grouped
+    by chapter id. Segments keep the order in which they appear in their
+    source file.
     """
     segments_dir = root / "renderer" / "public" / "segments"
     if not segments_dir.exists():
@@ -81,10 +100,10 @@ def load_sentence_segments(root: Path) -> List[Dict[str, Any]]:
     if not json_files:
         raise SystemExit(f"No segment JSON files found in {segments_dir}")
 
-    segments: List[Dict[str, Any]] = []
+    segments_by_chapter: Dict[str, List[Dict[str, Any]]] = {}
     for json_path in json_files:
         try:
-            data = json.loads(json_path.read_text(encoding="utf-8"))
+            data = json.loads(json_path.read_bytes())
         except json.JSONDecodeError as exc:
             raise SystemExit(f"Failed to parse {json_path}: {exc}") from exc
 
@@ -112,12 +131,16 @@ def load_sentence_segments(root: Path) -> List[Dict[str, Any]]:
                 "sentenceIds": entry.get("sentenceIds", []),
                 "isCodeBlock": bool(entry.get("isCodeBlock", False)),
             }
-            segments.append(normalized)
+            if not isinstance(normalized["chapterId"], str):
+                continue
+            segments_by_chapter.setdefault(normalized["chapterId"], []).append(
+                normalized
+            )
 
-    if not segments:
+    if not segments_by_chapter:
         raise SystemExit("No valid segments loaded from JSON files.")
 
-    return segments
+    return segments_by_chapter
 
 
 def load_sentence_transcripts_for_chapter(
@@ -132,7 +155,7 @@ def load_sentence_transcripts_for_chapter(
     if not path.exists():
         raise SystemExit(f"Sentence transcripts file not found: {path}")
 
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = json.loads(path.read_bytes())
     # The files use a flat mapping: { "c1-s1": { ... }, "c1-s2": { ... }, ... }
     # We keep it as-is but ensure keys are strings.
     return {str(k): v for k, v in data.items()}
@@ -146,11 +169,15 @@ def build_segment_ipa(
     Given a segment record and the sentence-level data for its chapter,
     concatenate the `ipa` fields in order to produce the segment IPA text.
     """
+    sentence_ids = segment.get("sentenceIds", [])
+
+    # Validate each sentence once, collecting its IPA alongside any problems
+    # worth reporting.
     ipa_chunks: List[str] = []
     missing_sentences: List[str] = []
     han_sentences: List[tuple[str, str]] = []
 
-    for sent_id in segment.get("sentenceIds", []):
+    for sent_id in sentence_ids:
         entry = sentence_data.get(sent_id)
         if entry is None:
             missing_sentences.append(sent_id)
@@ -204,6 +231,51 @@ def build_segment_ipa(
     return " ".join(ipa_chunks).strip()
 
 
+def build_chapter_segment_transcripts(
+    root: Path,
+    chapter_id: str,
+    chapter_segments: List[Dict[str, Any]],
+) -> int:
+    """
+    Write the segment transcript files for a single chapter and return how
+    many were written.
+    """
+    transcripts_dir = root / "renderer" / "public" / "transcripts"
+    build_dir = transcripts_dir / "build"
+
+    written = 0
+    sentence_data = load_sentence_transcripts_for_chapter(transcripts_dir, chapter_id)
+
+    for seg in chapter_segments:
+        seg_id = seg.get("id")
+        if not isinstance(seg_id, str):
+            continue
+
+        ipa_body = build_segment_ipa(seg, sentence_data)
+        if not ipa_body:
+            print_warning(
+                "No IPA constructed for segment",
+                format_metadata_rows(
+                    [
+                        ("Segment ID", seg_id),
+                        ("Chapter ID", chapter_id),
+                    ]
+                ),
+            )
+            continue
+
+        # TTS engine requires exactly one leading and trailing space
+        # around the content.
+        ipa_text = f" {ipa_body.strip()} "
+        out_path = build_dir / f"audio-{seg_id}.txt"
+        out_path.write_text(ipa_text, encoding="utf-8")
+        written += 1
+
+        print(f"    • Wrote {out_path.relative_to(root)}")
+
+    return written
+
+
 def reconstruct_segment_transcripts(root: Path, chapter_filter: int | None = None) -> None:
     transcripts_dir = root / "renderer" / "public" / "transcripts"
     build_dir = transcripts_dir / "build"
@@ -211,23 +283,18 @@ def reconstruct_segment_transcripts(root: Path, chapter_filter: int | None = Non
     # Ensure the build directory exists and is clean so stale
     # transcript files don't linger between runs.
     build_dir.mkdir(parents=True, exist_ok=True)
-    for stale in build_dir.glob("audio-*.txt"):
-        stale.unlink()
-
-    segments = load_sentence_segments(root)
-    if not segments:
+    with os.scandir(build_dir) as entries:
+        for entry in entries:
+            if entry.name.startswith("audio-") and entry.name.endswith(".txt"):
+                os.unlink(entry.path)
+
+    # Segments come back grouped by chapter id so we can load each chapter's
+    # sentence transcripts only once.
+    segments_by_chapter = load_sentence_segments(root)
+    if not segments_by_chapter:
         print("No sentence segments found; nothing to do.")
         return
 
-    # Group segments by chapter id so we can load each chapter's sentence
-    # transcripts only once.
-    segments_by_chapter: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
-    for seg in segments:
-        chapter_id = seg.get("chapterId")
-        if not isinstance(chapter_id, str):
-            continue
-        segments_by_chapter[chapter_id].append(seg)
-
     if chapter_filter is not None:
         target_id = f"c{chapter_filter}"
         if target_id in segments_by_chapter:
@@ -238,50 +305,37 @@ def reconstruct_segment_transcripts(root: Path, chapter_filter: int | None = Non
 
     print("Building segment-level IPA transcripts from sentence data...")
 
-    total_written = 0
-    for chapter_id, chapter_segments in sorted(
-        segments_by_chapter.items(),
-        key=lambda item: (
-            int(item[0].lstrip("c")) if item[0].lstrip("c").isdigit() else 0
-        ),
-    ):
-        print(f"- Chapter {chapter_id}")
-
-        sentence_data = load_sentence_transcripts_for_chapter(
-            transcripts_dir, chapter_id
-        )
-
-        # Sort segments within the chapter by numeric segmentIndex
-        chapter_segments.sort(
-            key=lambda s: int(s.get("segmentIndex", 0)),
+    # Order by chapter number; ties (malformed ids map to 0) fall back to the
+    # id itself so the ordering is deterministic.
+    ordered_chapters = sorted(
+        (
+            int(chapter_id.lstrip("c")) if chapter_id.lstrip("c").isdigit() else 0,
+            chapter_id,
+            chapter_segments,
         )
+        for chapter_id, chapter_segments in segments_by_chapter.items()
+    )
 
-        for seg in chapter_segments:
-            seg_id = seg.get("id")
-            if not isinstance(seg_id, str):
-                continue
-
-            ipa_body = build_segment_ipa(seg, sentence_data)
-            if not ipa_body:
-                print_warning(
-                    "No IPA constructed for segment",
-                    format_metadata_rows(
-                        [
-                            ("Segment ID", seg_id),
-                            ("Chapter ID", chapter_id),
-                        ]
-                    ),
-                )
-                continue
-
-            # TTS engine requires exactly one leading and trailing space
-            # around the content.
-            ipa_text = f" {ipa_body.strip()} "
-            out_path = build_dir / f"audio-{seg_id}.txt"
-            out_path.write_text(ipa_text, encoding="utf-8")
-            total_written += 1
-
-            print(f"    • Wrote {out_path.relative_to(root)}")
+    # Chapters are independent (separate inputs and output files), so build
+    # them in parallel.
+    total_written = 0
+    max_workers = min(os.cpu_count() or 1, len(ordered_chapters))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_logged,
+                build_chapter_segment_transcripts,
+                f"- Chapter {chapter_id}",
+                root=root,
+                chapter_id=chapter_id,
+                chapter_segments=chapter_segments,
+            )
+            for _, chapter_id, chapter_segments in ordered_chapters
+        ]
+        for future in futures:
+            log, written = future.result()
+            print(log, end="")
+            total_written += written
 
     print(f"Done. Wrote {total_written} segment transcript files.")
 
@@ -1,17 +1,31 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, TypedDict
 
 import re
 
 
-@dataclass
-class Sentence:
+_RE_HEADING = re.compile(r"^#+\s+.*$", re.MULTILINE)
+_RE_LIST = re.compile(r"^-\s+", re.MULTILINE)
+_RE_SPACES = re.compile(r"[ \t]+")
+_RE_NEWLINES = re.compile(r"\n+")
+_RE_SENTENCE = re.compile(r"[^。\n]*。|[^。\n]+")
+_RE_SENTENCE_DELIMITERS = re.compile(r"。|\n+")
+_RE_NON_SPACE = re.compile(r"\S")
+_RE_CHINESE_BOUNDARY = re.compile(r"[『』」。！？]|\n+")
+_RE_DOUBLE_BRACKETS = re.compile(r"「「|」」")
+_DOUBLE_BRACKETS = {"「「": "『", "」」": "』"}
+
+
+class Sentence(TypedDict):
     """
-    Canonical sentence unit.
+    Canonical sentence unit, kept as a plain dict so it can be serialized
+    without conversion.
 
     - `source` is the text used for transcription/translation.
       For prose it is markdown-cleaned; for code it preserves original
@@ -27,6 +41,29 @@ class Sentence:
     isCode: bool
 
 
+def normalize_double_brackets(text: str) -> str:
+    """Convert double corner brackets 「「 」」 to 『 』 in a single pass."""
+    if "「「" not in text and "」」" not in text:
+        return text
+    return _RE_DOUBLE_BRACKETS.sub(lambda m: _DOUBLE_BRACKETS[m.group()], text)
+
+
+def normalize_plain_text(text: str) -> str:
+    """
+    Clean up prose whose markdown markers are already stripped: convert
+    double brackets, collapse runs of spaces/tabs and of newlines, and trim.
+    """
+    text = normalize_double_brackets(text)
+    # Replace multiple spaces/tabs with single space. A lone space is
+    # already collapsed, so only scan when there is something to change.
+    if "\t" in text or "  " in text:
+        text = _RE_SPACES.sub(" ", text)
+    # Replace multiple newlines with single newline
+    if "\n\n" in text:
+        text = _RE_NEWLINES.sub("\n", text)
+    return text.strip()
+
+
 def remove_markdown(text: str, preserve_newlines: bool = False) -> str:
     """
     Remove markdown formatting from text, preserving logical content.
@@ -34,25 +71,20 @@ def remove_markdown(text: str, preserve_newlines: bool = False) -> str:
     This mirrors the behavior in `segment-text.py` so that segmentation
     remains consistent with the existing pipeline.
     """
-    # Convert double brackets 「「　」」 to 『 』
-    text = text.replace("「「", "『")
-    text = text.replace("」」", "』")
-
-    # Remove headings (# ...)
-    text = re.sub(r"^#+\s+.*$", "", text, flags=re.MULTILINE)
+    # Remove headings (# ...). Most blocks have none, so only run the
+    # multiline regex when some line actually starts with the marker.
+    if text.startswith("#") or "\n#" in text:
+        text = _RE_HEADING.sub("", text)
 
     # Remove list markers (- ...) but keep the content
-    text = re.sub(r"^-\s+", "", text, flags=re.MULTILINE)
+    if text.startswith("-") or "\n-" in text:
+        text = _RE_LIST.sub("", text)
 
     if preserve_newlines:
-        # For code blocks, preserve newlines and the exact amount of whitespace.
-        return text
-    else:
-        # Replace multiple spaces/tabs with single space
-        text = re.sub(r"[ \t]+", " ", text)
-        # Replace multiple newlines with single newline
-        text = re.sub(r"\n+", "\n", text)
-        return text.strip()
+        # For code blocks, preserve newlines and the exact amount of whitespace;
+        # only convert double brackets 「「　」」 to 『 』.
+        return normalize_double_brackets(text)
+    return normalize_plain_text(text)
 
 
 def split_chinese_sentences(text: str, preserve_spaces: bool = False) -> List[str]:
@@ -63,22 +95,28 @@ def split_chinese_sentences(text: str, preserve_spaces: bool = False) -> List[st
     `renderer/scripts/generate-segments.ts` so that code blocks and
     prose are segmented in a compatible way.
     """
+    # Lines without quotes, sentence-ending punctuation or newlines (common in
+    # code blocks) are a single sentence as-is.
+    if _RE_CHINESE_BOUNDARY.search(text) is None:
+        processed = text if preserve_spaces else text.strip()
+        return [processed] if processed else []
+
     sentences: List[str] = []
-    current_sentence: List[str] = []
+    start = 0  # index where the current sentence begins
     inside_quotes = False  # for 『 ... 』
 
-    i = 0
     length = len(text)
 
-    while i < length:
-        char = text[i]
+    # Only quote marks, sentence-ending punctuation and newline runs can
+    # change state, so jump between them and leave everything else to C.
+    for match in _RE_CHINESE_BOUNDARY.finditer(text):
+        char = match.group()
+        i = match.start()
 
         if char == "『":
             inside_quotes = True
-            current_sentence.append(char)
         elif char == "』":
             inside_quotes = False
-            current_sentence.append(char)
 
             # Check if previous character was sentence-ending punctuation
             if i > 0:
@@ -88,47 +126,33 @@ def split_chinese_sentences(text: str, preserve_spaces: bool = False) -> List[st
                     # sentence-ending punctuation (e.g., don't split "。』。")
                     next_char = text[i + 1] if i + 1 < length else None
                     if next_char not in ("。", "！", "？"):
-                        processed = "".join(current_sentence)
+                        processed = text[start : i + 1]
                         if not preserve_spaces:
                             processed = processed.strip()
                         if processed:
                             sentences.append(processed)
-                        current_sentence = []
+                        start = i + 1
         elif char == "」":
-            # Always include the closing quote
-            current_sentence.append(char)
-
             # Look ahead for the next non-whitespace character.
             # If it's 「曰」, we treat this as a sentence boundary so that
             # patterns like `…耶」曰「…耶」` or `…耶」\n曰「…耶」` are split
-            # between `」` and `曰`.
-            j = i + 1
-            next_non_ws: str | None = None
-            while j < length:
-                lookahead = text[j]
-                if not lookahead.isspace():
-                    next_non_ws = lookahead
-                    break
-                j += 1
-
-            if next_non_ws == "曰":
-                processed = "".join(current_sentence)
+            # between `」` and `曰` (the closing quote stays with the sentence).
+            lookahead = _RE_NON_SPACE.search(text, i + 1)
+            if lookahead is not None and lookahead.group() == "曰":
+                processed = text[start : i + 1]
                 if not preserve_spaces:
                     processed = processed.strip()
                 if processed:
                     sentences.append(processed)
-                current_sentence = []
-        elif char == "\n" and not inside_quotes:
-            # Treat consecutive newlines as a single delimiter.
-            # Collect all consecutive newlines.
-            newlines = [char]
-            j = i + 1
-            while j < length and text[j] == "\n":
-                newlines.append(text[j])
-                j += 1
-
-            # Flush the current sentence (without the newlines).
-            processed = "".join(current_sentence)
+                start = i + 1
+        elif inside_quotes:
+            # Newlines and sentence-ending punctuation inside 『 ... 』 are
+            # part of the quoted sentence.
+            continue
+        elif char[0] == "\n":
+            # Consecutive newlines arrive as one match and act as a single
+            # delimiter. Flush the current sentence (without the newlines).
+            processed = text[start:i]
             if not preserve_spaces:
                 processed = processed.strip()
             if processed:
@@ -138,30 +162,24 @@ def split_chinese_sentences(text: str, preserve_spaces: bool = False) -> List[st
             # in code blocks (where preserve_spaces=True).
             # For prose (preserve_spaces=False), the newlines will be stripped
             # from the start of the next sentence.
-            current_sentence = newlines
-            i = j - 1  # Will be incremented at end of loop
-        elif char in ("。", "！", "？") and not inside_quotes:
-            current_sentence.append(char)
-            
+            start = i
+        else:
+            # Sentence-ending punctuation: 。！？
             # Check if next char is closing quote
             next_char = text[i + 1] if i + 1 < length else None
             if next_char == "』" or next_char == "」":
                 # Don't split here, let the closing quote handler deal with it
                 pass
             else:
-                processed = "".join(current_sentence)
+                processed = text[start : i + 1]
                 if not preserve_spaces:
                     processed = processed.strip()
                 if processed:
                     sentences.append(processed)
-                current_sentence = []
-        else:
-            current_sentence.append(char)
-
-        i += 1
+                start = i + 1
 
     # Add any remaining text as the last sentence
-    processed = "".join(current_sentence)
+    processed = text[start:]
     if not preserve_spaces:
         processed = processed.strip()
     if processed:
@@ -178,34 +196,18 @@ def split_sentences(text: str) -> List[str]:
     Trailing fragments that don't end with '。' are also included
     (e.g., "運行之。乃得" -> ["運行之。", "乃得"]).
     """
+    # Fastest path: nothing to split on, so the whole text is one fragment.
+    if "。" not in text and "\n" not in text and "`" not in text:
+        stripped = text.strip()
+        return [stripped] if stripped else []
+
     # Fast path: no backticks, use simple splitting to preserve legacy behavior.
     if "`" not in text:
-        sentences: List[str] = []
-        # Split by 。 or sequences of \n, keeping the delimiters
-        # Use regex to match 。 or one or more consecutive \n
-        tokens = re.split(r"([。]|\n+)", text)
-
-        current_parts: List[str] = []
-        for token in tokens:
-            if token == "。":
-                current_parts.append(token)
-                sentences.append("".join(current_parts).strip())
-                current_parts = []
-            elif token and token.startswith("\n"):
-                # Treat consecutive newlines as a single delimiter
-                if current_parts:
-                    sentences.append("".join(current_parts).strip())
-                    current_parts = []
-                # Note: In prose (no backticks), we drop the newlines as a separator
-            else:
-                if token:
-                    current_parts.append(token)
-
-        if current_parts:
-            sentences.append("".join(current_parts).strip())
-
-        # Return all sentences (those ending with '。' and any trailing fragment)
-        return [s for s in sentences if s]
+        # A sentence is a run ending in '。' (kept) or a run cut off by
+        # newlines or the end of text (trailing fragment); consecutive
+        # newlines act as a single separator and are dropped.
+        stripped = (s.strip() for s in _RE_SENTENCE.findall(text))
+        return [s for s in stripped if s]
 
     # Backtick-aware path: never break *inside* paired backticks.
     # We treat inline code spans as atomic units, but allow them to
@@ -218,32 +220,25 @@ def split_sentences(text: str) -> List[str]:
     # First, tokenize into (segment, is_code) pairs, where code segments
     # are delimited by backticks and never split.
     tokens: List[tuple[str, bool]] = []
-    i = 0
+    pos = 0
     n = len(text)
 
-    while i < n:
-        ch = text[i]
-        if ch == "`":
-            # Capture everything until the next backtick (or end of string).
-            j = i + 1
-            while j < n and text[j] != "`":
-                j += 1
-            if j < n:
-                token = text[i : j + 1]
-                i = j + 1
-            else:
-                token = text[i:]
-                i = n
-            tokens.append((token, True))
-        else:
-            # Plain text until the next backtick.
-            j = i
-            while j < n and text[j] != "`":
-                j += 1
-            token = text[i:j]
-            if token:
-                tokens.append((token, False))
-            i = j
+    while pos < n:
+        # Jump straight to the next backtick; everything before it is plain.
+        tick = text.find("`", pos)
+        if tick == -1:
+            tokens.append((text[pos:], False))
+            break
+        if tick > pos:
+            tokens.append((text[pos:tick], False))
+
+        # Capture everything until the next backtick (or end of string).
+        close = text.find("`", tick + 1)
+        if close == -1:
+            tokens.append((text[tick:], True))
+            break
+        tokens.append((text[tick : close + 1], True))
+        pos = close + 1
 
     sentences: List[str] = []
     current_parts: List[str] = []
@@ -265,33 +260,27 @@ def split_sentences(text: str) -> List[str]:
         else:
             # Plain text may contain multiple '。' or '\n' characters; we split
             # on them, but never cross into code spans.
-            buf: List[str] = []
-            # Regex split for plain text segment - treat consecutive newlines as one
-            parts = re.split(r"([。]|\n+)", segment)
-            for part in parts:
-                if part == "。":
-                    buf.append(part)
-                    current_parts.append("".join(buf))
+            # Consecutive newlines match as one delimiter.
+            seg_start = 0
+            for delimiter in _RE_SENTENCE_DELIMITERS.finditer(segment):
+                if delimiter.group() == "。":
+                    current_parts.append(segment[seg_start : delimiter.end()])
                     sentence = "".join(current_parts).strip()
                     if sentence:
                         sentences.append(sentence)
                     current_parts = []
-                    buf = []
-                elif part and part.startswith("\n"):
+                else:
                     # Split on consecutive newlines (treated as single delimiter)
-                    if buf:
-                        current_parts.append("".join(buf))
-                        buf = []
+                    if delimiter.start() > seg_start:
+                        current_parts.append(segment[seg_start : delimiter.start()])
                     if current_parts:
                         sentence = "".join(current_parts).strip()
                         if sentence:
                             sentences.append(sentence)
                         current_parts = []
-                else:
-                    if part:
-                        buf.append(part)
-            if buf:
-                current_parts.append("".join(buf))
+                seg_start = delimiter.end()
+            if seg_start < len(segment):
+                current_parts.append(segment[seg_start:])
 
     # Add any remaining text as the last sentence.
     # Include trailing fragments even if they don't end with '。'
@@ -311,8 +300,7 @@ def build_sentences_for_chapter(chapter_path: Path, output_dir: Path) -> None:
     Read a chapter JSON from `renderer/public/chapters` and emit
     a sentence-level JSON file under `renderer/public/sentences`.
     """
-    with chapter_path.open("r", encoding="utf-8") as f:
-        chapter_data: Dict[str, Any] = json.load(f)
+    chapter_data: Dict[str, Any] = json.loads(chapter_path.read_bytes())
 
     chapter_id = chapter_data.get("id")
     chapter_num = chapter_data.get("number")
@@ -352,7 +340,7 @@ def build_sentences_for_chapter(chapter_path: Path, output_dir: Path) -> None:
             # runs like `曰「「問天地好在。」」` are treated as a single
             # sentence, not split in the middle.
             # We preserve all spacing and newlines.
-            normalized_code_text = code_text.replace("「「", "『").replace("」」", "』")
+            normalized_code_text = normalize_double_brackets(code_text)
 
             code_sentences = split_chinese_sentences(
                 normalized_code_text, preserve_spaces=True
@@ -380,10 +368,14 @@ def build_sentences_for_chapter(chapter_path: Path, output_dir: Path) -> None:
             if not items:
                 continue
 
-            # Reconstruct markdown list paragraph to keep behavior consistent
-            paragraph_markdown = "\n".join(f"- {item}" for item in items)
-            text = remove_markdown(paragraph_markdown, preserve_newlines=False)
-            if not text.strip():
+            # Items are already single lines without their "- " marker, so
+            # clean them directly instead of rebuilding list markdown only
+            # for `remove_markdown` to strip the markers again. Keeping one
+            # item per line preserves the newline sentence boundaries.
+            text = normalize_plain_text(
+                "\n".join(item.strip() for item in items if item and item.strip())
+            )
+            if not text:
                 continue
 
             parts = split_sentences(text)
@@ -433,7 +425,7 @@ def build_sentences_for_chapter(chapter_path: Path, output_dir: Path) -> None:
         "chapterId": chapter_id,
         "number": chapter_num,
         "title": title,
-        "sentences": [asdict(s) for s in sentences],
+        "sentences": sentences,
     }
 
     # Store canonical sentences as `c{n}.sentences.json` to avoid confusion
@@ -461,8 +453,14 @@ def main() -> None:
         print(f"No chapter JSON files found in {chapters_dir}")
         return
 
-    for chapter_json in chapter_files:
-        build_sentences_for_chapter(chapter_json, output_dir)
+    # Chapters are independent, so build them in parallel processes.
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        list(
+            executor.map(
+                partial(build_sentences_for_chapter, output_dir=output_dir),
+                chapter_files,
+            )
+        )
 
 
 if __name__ == "__main__":
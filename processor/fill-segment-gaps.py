@@ -11,6 +11,7 @@ Works with:
 - Audio files: audio-{chapter}-{segment}.mp3
 - Female audio files: audio-{chapter}-{segment}-f.mp3
 - Transcript files: audio-{chapter}-{segment}.txt
+- Translation files: {chapter}-{segment}.txt
 
 Usage:
     uv run fill-segment-gaps.py <chapter> [--start <number>] [--min <number>] [--max <number>]
@@ -26,16 +27,28 @@ Examples:
 import argparse
 import re
 from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
 
 # Base directory (renderer/public from processor directory)
 BASE_DIR = Path(__file__).parent.parent / "renderer" / "public"
 
+# Subdirectories of BASE_DIR that never hold per-segment files. Every other
+# subdirectory (segments, audios, transcripts, translations, ...) is searched,
+# so a newly added per-segment folder is renumbered along with the rest.
+SKIPPED_SUBDIRS = frozenset({"chapters", "sentences", "images", "fonts"})
+
+
+@lru_cache(maxsize=None)
+def _number_pattern(pattern_prefix: str) -> re.Pattern[str]:
+    return re.compile(rf"{re.escape(pattern_prefix)}(\d+)")
+
 
 def extract_number_from_filename(filename: str, pattern_prefix: str):
     """Extract the segment number from a filename."""
     # Match pattern like "1-15" or "audio-1-15" or "audio-1-15-f"
-    match = re.search(rf"{re.escape(pattern_prefix)}(\d+)", filename)
+    match = _number_pattern(pattern_prefix).search(filename)
     if match:
         return int(match.group(1))
     return None
@@ -52,36 +65,68 @@ def find_files_to_rename(
     if exclude_patterns is None:
         exclude_patterns = []
 
+    exclude_re = (
+        re.compile("|".join(map(re.escape, exclude_patterns)))
+        if exclude_patterns
+        else None
+    )
+
     files_by_dir = defaultdict(list)
-    processed_files = set()  # Track files we've already found to avoid duplicates
 
-    # Search recursively for files matching the pattern
-    for old_num in range(min_number, max_number + 1):
-        old_pattern = f"{pattern_prefix}{old_num}"
-        for file_path in base_dir.rglob(f"*{old_pattern}*"):
-            if file_path.is_file():
-                # Skip if we've already processed this file
-                if file_path in processed_files:
-                    continue
-
-                # Skip if file matches any exclude pattern
-                skip = False
-                for exclude in exclude_patterns:
-                    if exclude in file_path.name:
-                        skip = True
-                        break
-                if skip:
-                    continue
-
-                # Verify this file actually matches our number pattern
-                num = extract_number_from_filename(file_path.name, pattern_prefix)
-                if num == old_num:
-                    files_by_dir[file_path.parent].append((file_path, old_num))
-                    processed_files.add(file_path)
+    candidates = chain.from_iterable(
+        (entry.rglob("*") if entry.is_dir() else (entry,))
+        for entry in base_dir.iterdir()
+        if entry.name not in SKIPPED_SUBDIRS
+    )
+
+    # Walk the tree once and bucket files by the number in their name,
+    # rather than re-walking it for every number in the range.
+    for file_path in candidates:
+        if not file_path.is_file():
+            continue
+
+        # Skip if file matches any exclude pattern
+        if exclude_re and exclude_re.search(file_path.name):
+            continue
+
+        num = extract_number_from_filename(file_path.name, pattern_prefix)
+        if num is not None and min_number <= num <= max_number:
+            files_by_dir[file_path.parent].append((file_path, num))
 
     return files_by_dir
 
 
+def _rename_directly(
+    files_to_rename: list,
+    pattern_prefix: str,
+    start_number: int,
+    descending: bool = False,
+) -> int:
+    """Rename files straight to their final names in a single pass."""
+    renamed = []
+    current_new_num = start_number
+
+    for old_file, old_num in files_to_rename:
+        if not old_file.exists():
+            print(f"    SKIP: {old_file.name} (does not exist)")
+            continue
+        renamed.append((old_file, old_num, current_new_num))
+        current_new_num += 1
+
+    if descending:
+        renamed.reverse()
+
+    print(f"  Renaming directly (no name collisions possible)...")
+    for old_file, old_num, new_num in renamed:
+        old_pattern = f"{pattern_prefix}{old_num}"
+        new_pattern = f"{pattern_prefix}{new_num}"
+        new_name = old_file.name.replace(old_pattern, new_pattern)
+        print(f"    {old_file.name} -> {new_name}")
+        old_file.rename(old_file.parent / new_name)
+
+    return len(renamed)
+
+
 def rename_files_safely_in_dir(
     directory: Path, files_to_rename: list, pattern_prefix: str, start_number: int
 ):
@@ -95,6 +140,27 @@ def rename_files_safely_in_dir(
     # Sort by old_num to process in order
     files_to_rename.sort(key=lambda x: x[1])
 
+    # When no file's new name can collide with another file that is still
+    # waiting to be renamed, a single direct pass is enough. That holds when
+    # the old and new number ranges are disjoint, or when every number moves
+    # in the same direction and we rename in that order (e.g. 15..36 -> 14..35
+    # processed ascending).
+    existing = [(f, n) for f, n in files_to_rename if f.exists()]
+    moves = [
+        (old_num, start_number + offset)
+        for offset, (_, old_num) in enumerate(existing)
+    ]
+    source_nums = {old_num for old_num, _ in moves}
+    target_nums = {new_num for _, new_num in moves}
+    if source_nums.isdisjoint(target_nums) or all(
+        new_num <= old_num for old_num, new_num in moves
+    ):
+        return _rename_directly(files_to_rename, pattern_prefix, start_number)
+    if all(new_num >= old_num for old_num, new_num in moves):
+        return _rename_directly(
+            files_to_rename, pattern_prefix, start_number, descending=True
+        )
+
     # Phase 1: Rename all files to temporary names
     print(f"  Phase 1: Renaming to temporary names...")
     current_new_num = start_number
@@ -36,50 +36,69 @@ def _(CHAPTERS_DIR):
 
 
 @app.cell
-def _(chapter_files, json):
-    # Extract all source text from chapters
+def _(Counter, chapter_files, json):
+    # Extract all source text from chapters, keeping only what later cells
+    # use (id, title, the joined text and its character counts) instead of
+    # every parsed chapter
     all_text = []
-    chapter_data = []
+    chapter_texts = []
 
     for chapter_file in chapter_files:
-        with open(chapter_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            chapter_data.append(data)
-
-            # Extract source text from all blocks
-            for block in data.get("blocks", []):
-                source = block.get("source")
-                if source:
-                    all_text.append(source)
-
-                # Also check items in list blocks
-                items = block.get("items")
-                if items:
-                    for item in items:
-                        if isinstance(item, str):
-                            all_text.append(item)
+        data = json.loads(chapter_file.read_bytes())
+
+        # Extract source text from all blocks
+        chapter_text = []
+        for block in data.get("blocks", []):
+            source = block.get("source")
+            if source:
+                chapter_text.append(source)
+
+            # Also check items in list blocks
+            items = block.get("items")
+            if items:
+                for item in items:
+                    if isinstance(item, str):
+                        chapter_text.append(item)
+
+        all_text.extend(chapter_text)
+        joined_text = "".join(chapter_text)
+        chapter_texts.append(
+            {
+                "id": data.get("id", "unknown"),
+                "title": data.get("title", ""),
+                "text": joined_text,
+                "counter": Counter(joined_text),
+            }
+        )
 
     combined_text = "".join(all_text)
     print(f"Total characters extracted: {len(combined_text)}")
-    return chapter_data, combined_text
+    return chapter_texts, combined_text
 
 
 @app.cell
-def _(Counter, combined_text):
-    # Character statistics
-    char_counter = Counter(combined_text)
+def _(Counter, chapter_texts, combined_text):
+    # Character statistics, summed from the per-chapter counts so the text
+    # is only counted once
+    char_counter = Counter()
+    for _chapter in chapter_texts:
+        char_counter.update(_chapter["counter"])
     unique_chars = len(char_counter)
     total_chars = len(combined_text)
 
+    # Rank once; the top-N lists and every frequency table below slice or
+    # filter this ranking instead of sorting their own counters
+    char_ranking = char_counter.most_common()
+
     print(f"Total characters: {total_chars:,}")
     print(f"Unique characters: {unique_chars:,}")
-    return char_counter, total_chars, unique_chars
+    return char_ranking, total_chars, unique_chars
 
 
 @app.cell
-def _(char_counter, total_chars):
+def _(char_ranking, total_chars):
     # Most common characters
-    most_common = char_counter.most_common(50)
+    most_common = char_ranking[:50]
     print("\nTop 50 most common characters:")
     for char, count in most_common:
         percentage = (count / total_chars) * 100
@@ -88,11 +107,11 @@ def _(char_counter, total_chars):
 
 
 @app.cell
-def _(char_counter, total_chars):
+def _(char_ranking, total_chars):
     # Character frequency table (all characters)
     char_freq_data = [
         {"character": char, "count": count, "percentage": (count / total_chars) * 100}
-        for char, count in char_counter.most_common()
+        for char, count in char_ranking
     ]
     char_freq_data[:20]  # Show top 20
     return
@@ -106,22 +125,27 @@ def is_chinese_char(char):
 
 
 @app.cell
-def _(Counter, char_counter):
-    chinese_chars = {
-        char: count for char, count in char_counter.items() if is_chinese_char(char)
-    }
-    chinese_counter = Counter(chinese_chars)
-
-    print(f"Chinese characters: {len(chinese_counter):,}")
-    print(f"Non-Chinese characters: {len(char_counter) - len(chinese_counter):,}")
-    return (chinese_counter,)
+def _(char_ranking):
+    # Split the ranking into Chinese and non-Chinese characters in one pass;
+    # filtering keeps both lists in ranking order
+    chinese_ranking = []
+    non_chinese_ranking = []
+    for _entry in char_ranking:
+        if is_chinese_char(_entry[0]):
+            chinese_ranking.append(_entry)
+        else:
+            non_chinese_ranking.append(_entry)
+
+    print(f"Chinese characters: {len(chinese_ranking):,}")
+    print(f"Non-Chinese characters: {len(non_chinese_ranking):,}")
+    return chinese_ranking, non_chinese_ranking
 
 
 @app.cell
-def _(chinese_counter):
+def _(chinese_ranking):
     # Most common Chinese characters
-    chinese_most_common = chinese_counter.most_common(50)
-    chinese_total = sum(chinese_counter.values())
+    chinese_most_common = chinese_ranking[:50]
+    chinese_total = sum(cnt for _, cnt in chinese_ranking)
 
     print("\nTop 50 most common Chinese characters:")
     for chr, cnt in chinese_most_common:
@@ -131,34 +155,29 @@ def _(chinese_counter):
 
 
 @app.cell
-def _(chinese_counter, chinese_total):
+def _(chinese_ranking, chinese_total):
     # Chinese character frequency table
     chinese_freq_data = [
         {"character": char, "count": count, "percentage": (count / chinese_total) * 100}
-        for char, count in chinese_counter.most_common()
+        for char, count in chinese_ranking
     ]
     chinese_freq_data[:30]  # Show top 30 Chinese characters
     return
 
 
 @app.cell
-def _(Counter, char_counter):
-    # Filter non-Chinese characters
-    non_chinese_chars = {
-        char: count for char, count in char_counter.items() if not is_chinese_char(char)
-    }
-    non_chinese_counter = Counter(non_chinese_chars)
-
-    print(f"Non-Chinese characters: {len(non_chinese_counter):,}")
-    print(f"Total non-Chinese character count: {sum(non_chinese_counter.values()):,}")
-    return (non_chinese_counter,)
+def _(non_chinese_ranking):
+    # Non-Chinese characters
+    non_chinese_total = sum(nc_cnt for _, nc_cnt in non_chinese_ranking)
+    print(f"Non-Chinese characters: {len(non_chinese_ranking):,}")
+    print(f"Total non-Chinese character count: {non_chinese_total:,}")
+    return (non_chinese_total,)
 
 
 @app.cell
-def _(non_chinese_counter):
+def _(non_chinese_ranking, non_chinese_total):
     # Most common non-Chinese characters
-    non_chinese_most_common = non_chinese_counter.most_common(50)
-    non_chinese_total = sum(non_chinese_counter.values())
+    non_chinese_most_common = non_chinese_ranking[:50]
 
     print("\nTop 50 most common non-Chinese characters:")
     for nc_char, nc_count in non_chinese_most_common:
@@ -170,11 +189,11 @@ def _(non_chinese_counter):
             else nc_char
         )
         print(f"  {char_repr}: {nc_count:,} ({nc_percentage:.2f}%)")
-    return (non_chinese_total,)
+    return
 
 
 @app.cell
-def _(non_chinese_counter, non_chinese_total):
+def _(non_chinese_ranking, non_chinese_total):
     # Non-Chinese character frequency table
     non_chinese_freq_data = [
         {
@@ -184,31 +203,20 @@ def _(non_chinese_counter, non_chinese_total):
             "count": count,
             "percentage": (count / non_chinese_total) * 100,
         }
-        for char, count in non_chinese_counter.most_common()
+        for char, count in non_chinese_ranking
     ]
     non_chinese_freq_data[:30]  # Show top 30 non-Chinese characters
     return
 
 
 @app.cell
-def _(Counter, chapter_data, chapter_files):
+def _(chapter_texts):
     # Character distribution by chapter
     chapter_stats = []
 
-    for ch_file, ch_data in zip(chapter_files, chapter_data):
-        chapter_text = []
-        for ch_block in ch_data.get("blocks", []):
-            ch_source = ch_block.get("source")
-            if ch_source:
-                chapter_text.append(ch_source)
-            ch_items = ch_block.get("items")
-            if ch_items:
-                for ch_item in ch_items:
-                    if isinstance(ch_item, str):
-                        chapter_text.append(ch_item)
-
-        chapter_combined = "".join(chapter_text)
-        chapter_char_counter = Counter(chapter_combined)
+    for ch_text in chapter_texts:
+        chapter_combined = ch_text["text"]
+        chapter_char_counter = ch_text["counter"]
         chapter_chinese_chars = {
             char: count
             for char, count in chapter_char_counter.items()
@@ -217,8 +225,8 @@ def _(Counter, chapter_data, chapter_files):
 
         chapter_stats.append(
             {
-                "chapter": ch_data.get("id", "unknown"),
-                "title": ch_data.get("title", ""),
+                "chapter": ch_text["id"],
+                "title": ch_text["title"],
                 "total_chars": len(chapter_combined),
                 "unique_chars": len(chapter_char_counter),
                 "unique_chinese_chars": len(chapter_chinese_chars),
@@ -243,7 +251,7 @@ def _(Counter, chapter_data, chapter_files):
 def _(
     chapter_files,
     chapter_stats,
-    chinese_counter,
+    chinese_ranking,
     total_chars,
     unique_chars,
 ):
@@ -252,7 +260,7 @@ def _(
     print(f"\nTotal chapters analyzed: {len(chapter_files)}")
     print(f"Total characters: {total_chars:,}")
     print(f"Unique characters: {unique_chars:,}")
-    print(f"Unique Chinese characters: {len(chinese_counter):,}")
+    print(f"Unique Chinese characters: {len(chinese_ranking):,}")
     avg_chars_per_chapter = total_chars / len(chapter_files)
     avg_unique_chinese = sum(s["unique_chinese_chars"] for s in chapter_stats) / len(
         chapter_stats
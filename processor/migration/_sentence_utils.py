@@ -0,0 +1,129 @@
+"""
+Sentence helpers shared by the segment-to-sentence migration scripts.
+
+The convert-segment-* scripts and `generate_sentence_segments.py` split
+segment text and line it up with the canonical
+`renderer/public/sentences/c*.sentences.json` files, so they must agree on
+where sentences begin and end.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+
+_SENTENCE_ENDERS = frozenset("。！？")
+
+# The only characters split_chinese_sentences has to act on. A closing 」
+# matters only when the next non-whitespace character is 「曰」, where we
+# treat it as a sentence boundary so that patterns like `…耶」曰「…耶」` or
+# `…耶」\n曰「…耶」` are split between `」` and `曰` (the closing quote stays
+# in the sentence).
+_RE_SENTENCE_MARK = re.compile(r"[『』。！？]|」(?=\s*曰)")
+
+
+def split_chinese_sentences(text: str) -> List[str]:
+    """
+    Split Chinese text into sentences ending with '。', with special
+    handling for quoted text and corner quotes.
+
+    Mirrors the logic used in segment-text and build-sentences so that
+    segment-level sentence counts line up with canonical
+    `renderer/public/sentences/c*.sentences.json` files.
+    Handles quoted text properly (e.g., '。』。' should not split).
+    """
+    sentences: List[str] = []
+    start = 0  # index where the current sentence begins
+    inside_quotes = False  # for 『 ... 』
+    length = len(text)
+
+    def flush(end: int) -> None:
+        nonlocal start
+        processed = text[start:end].strip()
+        if processed:
+            sentences.append(processed)
+        start = end
+
+    # Runs of ordinary characters between marks are skipped by the regex.
+    for match in _RE_SENTENCE_MARK.finditer(text):
+        char = match[0]
+        i = match.start()
+        if char == "『":
+            inside_quotes = True
+        elif char == "』":
+            inside_quotes = False
+
+            # Check if previous character was sentence-ending punctuation
+            if i > 0 and text[i - 1] in _SENTENCE_ENDERS:
+                # Only split at 。』 if NOT immediately followed by another
+                # sentence-ending punctuation (e.g., don't split "。』。")
+                next_char = text[i + 1] if i + 1 < length else None
+                if next_char not in _SENTENCE_ENDERS:
+                    flush(i + 1)
+        elif char == "」":
+            flush(i + 1)
+        elif not inside_quotes:
+            flush(i + 1)
+
+    # Add any remaining text as the last sentence
+    flush(length)
+
+    # For migration we want to keep sentences that may end with closing
+    # quotes (e.g. 「…。」』), so don't drop sentences that don't literally
+    # end in 。/！/？. Just remove empty fragments.
+    return [s for s in sentences if s]
+
+
+def natural_segment_sort_key(path: Path) -> Tuple[int, int]:
+    """
+    Sort key for segment files like '1-2.txt' -> (1, 2).
+    """
+    name = path.stem  # "1-2"
+    parts = name.split("-")
+    if len(parts) != 2:
+        return (0, 0)
+    try:
+        return (int(parts[0]), int(parts[1]))
+    except ValueError:
+        return (0, 0)
+
+
+def group_segment_files(directory: Path) -> Dict[str, List[Path]]:
+    """
+    Scan `directory` once and group '{chapter}-{index}.txt' files by the
+    chapter part of their name (e.g. '1-2.txt' under '1'), each group in
+    natural segment order.
+    """
+    groups: Dict[str, List[Path]] = {}
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            name = entry.name
+            if "-" in name and name.endswith(".txt"):
+                chapter = name.partition("-")[0]
+                groups.setdefault(chapter, []).append(Path(entry.path))
+    for paths in groups.values():
+        paths.sort(key=natural_segment_sort_key)
+    return groups
+
+
+def load_chapter_sentences(sentences_path: Path) -> List[Dict[str, Any]]:
+    data = json.loads(sentences_path.read_bytes())
+    return list(data.get("sentences", []))
+
+
+_RE_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_for_comparison(text: str) -> str:
+    """
+    Normalize Chinese sentences for comparison:
+      - remove backticks (inline code markers)
+      - collapse whitespace
+    """
+    # Remove backticks (used in code/inline sentences)
+    text = text.replace("`", "")
+    return _RE_WHITESPACE.sub(" ", text).strip()
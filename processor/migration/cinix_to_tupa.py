@@ -1,23 +1,124 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Dict, Tuple
 
+import re
 import unicodedata
 
+_ACCUTE_ACCENT = "\u0301"
+_GRAVE_ACCENT = "\u0300"
+_CARON = "\u030c"
+_ORIGINAL_TONES = (_ACCUTE_ACCENT, _GRAVE_ACCENT, _CARON)
+
+_TONE_TABLE: Dict[str, str] = {
+    _ACCUTE_ACCENT: "q",
+    _GRAVE_ACCENT: "",
+    _CARON: "h",
+}
+
+# Onset (everything before the first vowel), medial + nucleus, and the
+# trailing coda consonants. The vowel length mark "ː" may appear in either
+# of the last two groups and is stripped from them afterwards.
+_RE_SYLLABLE = re.compile(r"([^aeiouɑɨəʉyʷ]*)(.*?)([mnŋptkjwː]*)", re.DOTALL)
+
+_ONSET_TABLE: Dict[str, str] = {
+    # Bilabial
+    "p": "p",
+    "pʰ": "ph",
+    "b": "b",
+    "m": "m",
+    # Alveolar
+    "t": "t",
+    "tʰ": "th",
+    "d": "d",
+    "n": "n",
+    "s": "s",
+    "z": "z",
+    "ʦ": "ts",
+    "ʣ": "dz",
+    "ʦʰ": "tsh",
+    # Alveolo-palatal
+    "ɕ": "sj",
+    "ʑ": "zj",
+    "ʨ": "tj",
+    "ʨʰ": "tjh",
+    "ʥ": "dj",
+    "ɲ": "nj",
+    # Retroflex
+    "ʂ": "sr",
+    "ʈ": "tr",
+    "ɖ": "dr",
+    "ɳ": "nr",
+    "ꭧ": "tsr",
+    "ꭧʰ": "tsrh",
+    "ꭦ": "dzr",
+    "l": "l",
+    # Palatal
+    "j": "j",
+    # Velar
+    "k": "k",
+    "kʰ": "kh",
+    "g": "g",
+    "ŋ": "ng",
+    # Others
+    "h": "h",
+    "ʔ": "q",
+    "ɦ": "gh",
+}
+
+_MEDIAL_TABLE: Dict[str, str] = {
+    "y": "wi",
+    "ʷ": "w",
+    "ɨ": "y",
+    "ị": "y",
+    "ʉ": "u",
+    "ỵ": "u",
+    "i": "i",
+}
+
+_NUCLEUS_TABLE: Dict[str, str] = {
+    "a": "ae",
+    "ạ": "ae",
+    "e": "e",
+    "ẹ": "ee",
+    "ɑ": "a",
+    "ə": "eo",
+    "i": "i",
+    "ɨ": "y",
+    "ị": "yi",
+    "u": "ou",
+    "ʉ": "u",
+    "o": "o",
+    "ọ": "oeu",
+}
+
+_SPECIAL_PAIRS: Dict[str, str] = {
+    "ɨə": "yo",
+    "ʉu": "u",
+}
+
+_CODA_TABLE: Dict[str, str] = {
+    "m": "m",
+    "n": "n",
+    "ŋ": "ng",
+    "p": "p",
+    "t": "t",
+    "k": "k",
+    "w": "w",
+    "j": "j",
+}
+
 
 def _separate_tone(rhyme: str) -> Tuple[str, str]:
     """Separate the tone diacritic from the rhyme, mirroring cinix.ts."""
-    ACCUTE_ACCENT = "\u0301"
-    GRAVE_ACCENT = "\u0300"
-    CARON = "\u030c"
-    ORIGINAL_TONES = (ACCUTE_ACCENT, GRAVE_ACCENT, CARON)
-
-    for tone in ORIGINAL_TONES:
+    for tone in _ORIGINAL_TONES:
         if tone in rhyme:
             return rhyme.replace(tone, ""), tone
     return rhyme, ""
 
 
+@lru_cache(maxsize=8192)
 def _convert_cinix_word_to_tupa(word: str) -> str:
     """
     Convert a single Cinix IPA syllable to TUPA transcription.
@@ -29,88 +130,20 @@ def _convert_cinix_word_to_tupa(word: str) -> str:
 
     result = unicodedata.normalize("NFD", word)
 
-    # Split into onset + rhyme
-    onset = ""
-    rhyme = ""
-    for idx, ch in enumerate(result):
-        if ch and ch in "aeiouɑɨəʉyʷ":
-            onset = result[:idx]
-            rhyme = result[idx:]
-            break
-    else:
-        onset = result
-        rhyme = ""
-
-    ONSET_TABLE: Dict[str, str] = {
-        # Bilabial
-        "p": "p",
-        "pʰ": "ph",
-        "b": "b",
-        "m": "m",
-        # Alveolar
-        "t": "t",
-        "tʰ": "th",
-        "d": "d",
-        "n": "n",
-        "s": "s",
-        "z": "z",
-        "ʦ": "ts",
-        "ʣ": "dz",
-        "ʦʰ": "tsh",
-        # Alveolo-palatal
-        "ɕ": "sj",
-        "ʑ": "zj",
-        "ʨ": "tj",
-        "ʨʰ": "tjh",
-        "ʥ": "dj",
-        "ɲ": "nj",
-        # Retroflex
-        "ʂ": "sr",
-        "ʈ": "tr",
-        "ɖ": "dr",
-        "ɳ": "nr",
-        "ꭧ": "tsr",
-        "ꭧʰ": "tsrh",
-        "ꭦ": "dzr",
-        "l": "l",
-        # Palatal
-        "j": "j",
-        # Velar
-        "k": "k",
-        "kʰ": "kh",
-        "g": "g",
-        "ŋ": "ng",
-        # Others
-        "h": "h",
-        "ʔ": "q",
-        "ɦ": "gh",
-    }
-
-    onset = ONSET_TABLE.get(onset, onset)
+    # Split into onset + medial/nucleus + coda
+    onset, medial_nucleus, coda = _RE_SYLLABLE.fullmatch(result).groups()
 
-    # Remove vowel length mark
-    rhyme = rhyme.replace("ː", "")
+    onset = _ONSET_TABLE.get(onset, onset)
 
-    medial_nucleus = ""
-    coda = ""
-    for i in range(len(rhyme) - 1, -1, -1):
-        ch = rhyme[i]
-        if ch and ch not in "mnŋptkjw":
-            coda = rhyme[i + 1 :]
-            medial_nucleus = rhyme[: i + 1]
-            break
+    # Remove vowel length mark
+    if "ː" in medial_nucleus:
+        medial_nucleus = medial_nucleus.replace("ː", "")
+    if "ː" in coda:
+        coda = coda.replace("ː", "")
 
     toneless_medial_nucleus, tone = _separate_tone(medial_nucleus)
 
-    ACCUTE_ACCENT = "\u0301"
-    GRAVE_ACCENT = "\u0300"
-    CARON = "\u030c"
-    TONE_TABLE: Dict[str, str] = {
-        ACCUTE_ACCENT: "q",
-        GRAVE_ACCENT: "",
-        CARON: "h",
-    }
-    tone = TONE_TABLE.get(tone, tone)
+    tone = _TONE_TABLE.get(tone, tone)
 
     toneless_medial_nucleus = unicodedata.normalize("NFC", toneless_medial_nucleus)
 
@@ -125,59 +158,19 @@ def _convert_cinix_word_to_tupa(word: str) -> str:
         medial = toneless_medial_nucleus[:-1]
         nucleus = toneless_medial_nucleus[-1]
 
-    SPECIAL_PAIRS: Dict[str, str] = {
-        "ɨə": "yo",
-        "ʉu": "u",
-    }
-
     pair = medial + nucleus
-    if pair in SPECIAL_PAIRS:
-        converted = SPECIAL_PAIRS[pair]
+    if pair in _SPECIAL_PAIRS:
+        converted = _SPECIAL_PAIRS[pair]
         medial = ""
         nucleus = converted
     else:
-        MEDIAL_TABLE: Dict[str, str] = {
-            "y": "wi",
-            "ʷ": "w",
-            "ɨ": "y",
-            "ị": "y",
-            "ʉ": "u",
-            "ỵ": "u",
-            "i": "i",
-        }
         if medial:
-            medial = MEDIAL_TABLE.get(medial, medial)
-
-        NUCLEUS_TABLE: Dict[str, str] = {
-            "a": "ae",
-            "ạ": "ae",
-            "e": "e",
-            "ẹ": "ee",
-            "ɑ": "a",
-            "ə": "eo",
-            "i": "i",
-            "ɨ": "y",
-            "ị": "yi",
-            "u": "ou",
-            "ʉ": "u",
-            "o": "o",
-            "ọ": "oeu",
-        }
+            medial = _MEDIAL_TABLE.get(medial, medial)
         if nucleus:
-            nucleus = NUCLEUS_TABLE.get(nucleus, nucleus)
-
-    CODA_TABLE: Dict[str, str] = {
-        "m": "m",
-        "n": "n",
-        "ŋ": "ng",
-        "p": "p",
-        "t": "t",
-        "k": "k",
-        "w": "w",
-        "j": "j",
-    }
+            nucleus = _NUCLEUS_TABLE.get(nucleus, nucleus)
+
     if coda:
-        coda = CODA_TABLE.get(coda, coda)
+        coda = _CODA_TABLE.get(coda, coda)
 
     # Fix: eo + m/p is invalid in strict TUPA -> use o
     if nucleus == "eo" and coda in ("m", "p"):
@@ -190,6 +183,8 @@ def _convert_cinix_word_to_tupa(word: str) -> str:
         onset = ""
 
     result = "".join([onset, medial, nucleus, coda, tone])
+    if result.isascii():
+        return result
     return unicodedata.normalize("NFC", result)
 
 
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import json
 import os
-import subprocess
+from bisect import bisect_right
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
-from shutil import which
 from typing import Any, Dict, List, Tuple
 
 from processor.utils.cli_style import (
@@ -15,8 +16,27 @@ from processor.utils.cli_style import (
     format_preview_entry,
     print_warning,
 )
-
-from cinix_to_tupa import convert_cinix_to_tupa
+from processor.utils.parallel import run_logged
+
+try:  # Support both `-m processor.migration...` and direct script execution
+    from ._sentence_utils import (
+        group_segment_files,
+        load_chapter_sentences,
+        normalize_for_comparison,
+        split_chinese_sentences,
+    )
+    from .cinix_to_tupa import convert_cinix_to_tupa
+except ImportError:
+    if __package__ in (None, "", "__main__"):
+        from _sentence_utils import (
+            group_segment_files,
+            load_chapter_sentences,
+            normalize_for_comparison,
+            split_chinese_sentences,
+        )
+        from cinix_to_tupa import convert_cinix_to_tupa
+    else:  # pragma: no cover - unexpected import failure
+        raise
 
 
 def load_qieyun_dictionary() -> Dict[str, List[Tuple[str, int]]]:
@@ -45,10 +65,9 @@ def load_qieyun_dictionary() -> Dict[str, List[Tuple[str, int]]]:
     dictionary: Dict[str, List[Tuple[str, int]]] = {}
     text = cache_path.read_text(encoding="utf-8")
     for line in text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        parts = line.split("\t")
+        # Blank lines split into a single field and are skipped with the
+        # other malformed lines.
+        parts = line.strip().split("\t")
         if len(parts) != 3:
             continue
         ch, trans, freq_s = parts
@@ -56,177 +75,15 @@ def load_qieyun_dictionary() -> Dict[str, List[Tuple[str, int]]]:
             freq = int(freq_s)
         except ValueError:
             freq = 0
-        if ch not in dictionary:
-            dictionary[ch] = []
-        dictionary[ch].append((trans, freq))
+        dictionary.setdefault(ch, []).append((trans, freq))
 
-    for ch in dictionary:
-        dictionary[ch].sort(key=lambda x: x[1], reverse=True)
+    for readings in dictionary.values():
+        readings.sort(key=itemgetter(1), reverse=True)
 
     print(f"  ℹ Loaded Qieyun dictionary: {len(dictionary)} characters")
     return dictionary
 
 
-def resolve_bun_executable() -> Path | None:
-    """Locate Bun using environment hints or PATH."""
-    bun_candidates: List[Path] = []
-
-    bun_install = os.getenv("BUN_INSTALL")
-    if bun_install:
-        bun_candidates.append(Path(bun_install) / "bin" / "bun")
-
-    bun_path = os.getenv("BUN_PATH")
-    if bun_path:
-        bun_candidates.append(Path(bun_path))
-
-    default_install = Path.home() / ".bun" / "bin" / "bun"
-    bun_candidates.append(default_install)
-
-    path_candidate = which("bun")
-    if path_candidate:
-        bun_candidates.append(Path(path_candidate))
-
-    for candidate in bun_candidates:
-        if candidate and candidate.is_file() and os.access(candidate, os.X_OK):
-            return candidate.resolve()
-
-    return None
-
-
-LOOKUP_SCRIPT = Path(__file__).resolve().parents[1] / "lookup_meaning.ts"
-LOOKUP_CWD = LOOKUP_SCRIPT.parent
-BUN_EXECUTABLE = resolve_bun_executable()
-LOOKUP_SCRIPT_EXISTS = LOOKUP_SCRIPT.exists()
-BUN_EXISTS = BUN_EXECUTABLE is not None
-
-
-@lru_cache(maxsize=None)
-def _lookup_meaning_cached(
-    char: str, readings_key: Tuple[str, ...]
-) -> List[Dict[str, str]]:
-    """
-    Fetch transcription meanings using the local transcription helper.
-
-    This mirrors the behavior in transcribe.py but omits the remote fallback:
-    for migration we only rely on local data.
-    """
-
-    if not char:
-        return []
-    if not LOOKUP_SCRIPT_EXISTS:
-        print_warning(
-            "Local definition helper missing",
-            format_metadata_rows(
-                [
-                    ("Lookup script", LOOKUP_SCRIPT.as_posix()),
-                    ("Effect", "Choices will omit meanings"),
-                ]
-            ),
-        )
-        return []
-    if not BUN_EXISTS or BUN_EXECUTABLE is None:
-        print_warning(
-            "Bun executable not found",
-            format_metadata_rows(
-                [
-                    ("BUN_INSTALL", os.getenv("BUN_INSTALL", "")),
-                    ("BUN_PATH", os.getenv("BUN_PATH", "")),
-                    ("Effect", "Choices will omit meanings"),
-                ]
-            ),
-        )
-        return []
-
-    payload = {"entries": [{"char": char, "readings": list(readings_key)}]}
-
-    try:
-        completed = subprocess.run(
-            [str(BUN_EXECUTABLE), "run", str(LOOKUP_SCRIPT)],
-            input=json.dumps(payload),
-            capture_output=True,
-            text=True,
-            cwd=str(LOOKUP_CWD),
-            check=True,
-        )
-    except (FileNotFoundError, subprocess.CalledProcessError) as exc:
-        stderr = ""
-        if isinstance(exc, subprocess.CalledProcessError):
-            stderr = (exc.stderr or "").strip()
-        print_warning(
-            "Local definition lookup failed",
-            format_metadata_rows(
-                [
-                    ("Character", char),
-                    ("Script", LOOKUP_SCRIPT.as_posix()),
-                    ("Details", stderr or str(exc)),
-                ]
-            ),
-        )
-        return []
-    else:
-        try:
-            data = json.loads(completed.stdout or "{}")
-        except json.JSONDecodeError as exc:
-            print_warning(
-                "Invalid JSON from lookup helper",
-                format_metadata_rows(
-                    [
-                        ("Character", char),
-                        ("Script", LOOKUP_SCRIPT.as_posix()),
-                        ("Details", str(exc)),
-                    ]
-                ),
-            )
-            return []
-        results = data.get(char)
-        return results if isinstance(results, list) else []
-
-
-def lookup_meaning(char: str, readings: List[str]) -> List[Dict[str, str]]:
-    """
-    Return meanings for a single character keyed by its Cinix IPA readings.
-
-    The result is a list of objects like:
-      { "transcription": "...", "meaning": "..." }
-    in the same order as the provided readings.
-    """
-
-    readings_key = tuple(readings)
-    local_results = _lookup_meaning_cached(char, readings_key) or []
-
-    results_by_transcription: Dict[str, Dict[str, Any]] = {}
-    for item in local_results:
-        transcription = item.get("transcription")
-        if not isinstance(transcription, str):
-            continue
-        meaning = item.get("meaning", "")
-        results_by_transcription[transcription] = {
-            "transcription": transcription,
-            "meaning": meaning if isinstance(meaning, str) else "",
-        }
-
-    ordered_results: List[Dict[str, str]] = []
-    for reading in readings_key:
-        trimmed = reading if isinstance(reading, str) else ""
-        if not trimmed:
-            continue
-        entry = results_by_transcription.get(trimmed)
-        if entry:
-            meaning_value = entry.get("meaning")
-            ordered_results.append(
-                {
-                    "transcription": trimmed,
-                    "meaning": (
-                        meaning_value if isinstance(meaning_value, str) else ""
-                    ),
-                }
-            )
-        else:
-            ordered_results.append({"transcription": trimmed, "meaning": ""})
-
-    return ordered_results
-
-
 # Character replacement rules used during transcription; we reuse them to
 # align dictionary lookups with canonical sentence sources.
 CHAR_REPLACEMENTS: Dict[str, str] = {
@@ -236,19 +93,33 @@ CHAR_REPLACEMENTS: Dict[str, str] = {
     "」": "",
 }
 
+# The one-to-one replacements as a translation table. Leaving out the
+# deletions keeps translated text index-aligned with its source; they only
+# drop quote brackets, which are never looked up as Chinese characters.
+_DICT_CHAR_TABLE = str.maketrans(
+    {old: new for old, new in CHAR_REPLACEMENTS.items() if len(new) == 1}
+)
 
+
+# Boundaries of the half-open CJK ideograph ranges, flattened and sorted so
+# that a bisect lands on an odd index exactly when inside a range.
+_CJK_RANGES: Tuple[int, ...] = tuple(
+    bound
+    for start_end in (
+        (0x3400, 0x4DC0),  # Extension A
+        (0x4E00, 0xA000),  # Unified Ideographs
+        (0xF900, 0xFB00),  # Compatibility Ideographs
+        (0x20000, 0x2A6E0),  # Extension B
+        (0x2A700, 0x2CEB0),  # Extensions C-E (contiguous)
+    )
+    for bound in start_end
+)
+
+
+@lru_cache(maxsize=4096)
 def is_chinese_char(ch: str) -> bool:
     """Rudimentary check for CJK ideographs."""
-    code = ord(ch)
-    return (
-        0x4E00 <= code <= 0x9FFF
-        or 0x3400 <= code <= 0x4DBF
-        or 0x20000 <= code <= 0x2A6DF
-        or 0x2A700 <= code <= 0x2B73F
-        or 0x2B740 <= code <= 0x2B81F
-        or 0x2B820 <= code <= 0x2CEAF
-        or 0xF900 <= code <= 0xFAFF
-    )
+    return bisect_right(_CJK_RANGES, ord(ch)) & 1 == 1
 
 
 def build_choices_for_sentence(
@@ -270,157 +141,64 @@ def build_choices_for_sentence(
     if not source or not ipa or not dictionary:
         return []
 
-    # Enumerate Chinese characters with positional metadata.
-    chinese_positions: List[Dict[str, Any]] = []
+    source_for_dict = source.translate(_DICT_CHAR_TABLE)
+
+    # Most sentences have no character with several readings; skip the IPA
+    # alignment for those.
+    if not any(
+        len(dictionary.get(ch) or ()) > 1
+        for ch in source_for_dict
+        if is_chinese_char(ch)
+    ):
+        return []
+
+    # Tokenize the IPA string; tokens include '.' as separate items.
+    ipa_tokens = ipa.split()
+    token_count = len(ipa_tokens)
+    token_idx = 0
+
+    choices: List[Dict[str, Any]] = []
     same_char_counter: Dict[str, int] = defaultdict(int)
     chinese_index = 0
 
+    # Walk the Chinese characters with their positional metadata, aligning
+    # each one with the next non-period IPA token as we go.
     for index_in_source, ch in enumerate(source):
         if not is_chinese_char(ch):
             continue
 
-        char_for_dict = CHAR_REPLACEMENTS.get(ch, ch)
         occurrence_index = same_char_counter[ch]
         same_char_counter[ch] += 1
-
-        chinese_positions.append(
-            {
-                "char": ch,
-                "char_for_dict": char_for_dict,
-                "indexInSource": index_in_source,
-                "indexAmongChinese": chinese_index,
-                "sameCharIndex": occurrence_index,
-            }
-        )
+        index_among_chinese = chinese_index
         chinese_index += 1
 
-    if not chinese_positions:
-        return []
-
-    # Tokenize the IPA string; tokens include '.' as separate items.
-    ipa_tokens = [tok for tok in ipa.strip().split() if tok]
-    if not ipa_tokens:
-        return []
-
-    # Align each Chinese character with the next non-period IPA token.
-    token_idx = 0
-    for pos in chinese_positions:
-        while token_idx < len(ipa_tokens) and ipa_tokens[token_idx] == ".":
+        while token_idx < token_count and ipa_tokens[token_idx] == ".":
             token_idx += 1
-        if token_idx >= len(ipa_tokens):
+        if token_idx >= token_count:
             break
-        pos["ipa"] = ipa_tokens[token_idx]
+        ipa_token = ipa_tokens[token_idx]
         token_idx += 1
 
-    choices: List[Dict[str, Any]] = []
-
-    for pos in chinese_positions:
-        ipa_token = pos.get("ipa")
-        ch_dict = pos["char_for_dict"]
-        if not ipa_token or not ch_dict:
-            continue
-
-        readings = dictionary.get(ch_dict) or []
+        readings = dictionary.get(source_for_dict[index_in_source]) or []
         if len(readings) <= 1:
             # Only care about characters with multiple dictionary readings.
             continue
 
         # Since chosen_cinix is always equal to ipa_token, use ipa_token directly for tupa conversion
-        chosen_tupa = convert_cinix_to_tupa(ipa_token) if ipa_token else ""
-
         choices.append(
             {
-                "char": pos["char"],
-                "indexInSource": pos["indexInSource"],
-                "indexAmongChinese": pos["indexAmongChinese"],
-                "sameCharIndex": pos["sameCharIndex"],
+                "char": ch,
+                "indexInSource": index_in_source,
+                "indexAmongChinese": index_among_chinese,
+                "sameCharIndex": occurrence_index,
                 "ipa": ipa_token,
-                "tupa": chosen_tupa,
+                "tupa": convert_cinix_to_tupa(ipa_token),
             }
         )
 
     return choices
 
 
-def split_chinese_sentences(text: str) -> List[str]:
-    """
-    Split Chinese text into sentences ending with '。'.
-    Mirrors the logic used in segment-text and build-sentences.
-    Handles quoted text properly (e.g., '。』。' should not split).
-    """
-    sentences: List[str] = []
-    current_sentence: List[str] = []
-    inside_quotes = False  # for 『 ... 』
-
-    i = 0
-    length = len(text)
-
-    while i < length:
-        char = text[i]
-
-        if char == "『":
-            inside_quotes = True
-            current_sentence.append(char)
-        elif char == "』":
-            inside_quotes = False
-            current_sentence.append(char)
-
-            # Check if previous character was sentence-ending punctuation
-            if i > 0:
-                prev_char = text[i - 1]
-                if prev_char in ("。", "！", "？"):
-                    # Only split at 。』 if NOT immediately followed by another
-                    # sentence-ending punctuation (e.g., don't split "。』。")
-                    next_char = text[i + 1] if i + 1 < length else None
-                    if next_char not in ("。", "！", "？"):
-                        processed = "".join(current_sentence).strip()
-                        if processed:
-                            sentences.append(processed)
-                        current_sentence = []
-        elif char == "」":
-            # Always include the closing quote
-            current_sentence.append(char)
-
-            # Look ahead for the next non-whitespace character.
-            # If it's 「曰」, we treat this as a sentence boundary so that
-            # patterns like `…耶」曰「…耶」` or `…耶」\n曰「…耶」` are split
-            # between `」` and `曰`.
-            j = i + 1
-            next_non_ws: str | None = None
-            while j < length:
-                lookahead = text[j]
-                if not lookahead.isspace():
-                    next_non_ws = lookahead
-                    break
-                j += 1
-
-            if next_non_ws == "曰":
-                processed = "".join(current_sentence).strip()
-                if processed:
-                    sentences.append(processed)
-                current_sentence = []
-        elif char in ("。", "！", "？") and not inside_quotes:
-            current_sentence.append(char)
-            processed = "".join(current_sentence).strip()
-            if processed:
-                sentences.append(processed)
-            current_sentence = []
-        else:
-            current_sentence.append(char)
-
-        i += 1
-
-    # Add any remaining text as the last sentence
-    processed = "".join(current_sentence).strip()
-    if processed:
-        sentences.append(processed)
-
-    # For migration we want to keep sentences that may end with closing
-    # quotes (e.g. 「…。」』), so don't drop sentences that don't literally
-    # end in 。/！/？. Just remove empty fragments.
-    return [s for s in sentences if s]
-
-
 def split_ipa_sentences(ipa: str) -> List[str]:
     """
     Split an IPA transcription string into sentence-like units using '.' as marker.
@@ -433,19 +211,12 @@ def split_ipa_sentences(ipa: str) -> List[str]:
     if not ipa:
         return []
 
-    sentences: List[str] = []
-    current: List[str] = []
-
-    for ch in ipa:
-        current.append(ch)
-        if ch == ".":
-            s = "".join(current).strip()
-            if s:
-                sentences.append(s)
-            current = []
+    *parts, tail = ipa.split(".")
+    # Each piece keeps its '.' (and any space before it), so it is never empty
+    sentences = [(part + ".").lstrip() for part in parts]
 
     # Any trailing content without a '.' becomes a final sentence
-    tail = "".join(current).strip()
+    tail = tail.strip()
     if tail:
         sentences.append(tail)
 
@@ -502,25 +273,6 @@ def rebalance_ipa_sentences_for_segment(
     return rebalanced
 
 
-def natural_segment_sort_key(path: Path) -> Tuple[int, int]:
-    """
-    Sort key for segment files like '1-2.txt' -> (1, 2).
-    """
-    name = path.stem  # "1-2"
-    parts = name.split("-")
-    if len(parts) != 2:
-        return (0, 0)
-    try:
-        return (int(parts[0]), int(parts[1]))
-    except ValueError:
-        return (0, 0)
-
-
-def load_chapter_sentences(sentences_path: Path) -> List[Dict[str, Any]]:
-    data = json.loads(sentences_path.read_text(encoding="utf-8"))
-    return list(data.get("sentences", []))
-
-
 def convert_chapter(
     chapter_id: str,
     sentences_dir: Path,
@@ -528,10 +280,14 @@ def convert_chapter(
     transcripts_dir: Path,
     output_dir: Path,
     dictionary: Dict[str, List[Tuple[str, int]]],
+    segment_files: List[Path],
 ) -> None:
     """
     Convert existing segment-based transcripts for one chapter into
     sentence-based transcripts.
+
+    `segment_files` are the chapter's files from `segments_dir`, in natural
+    segment order (see `group_segment_files`).
     """
     # Canonical sentences are stored as `c{n}.sentences.json`.
     sentences_path = sentences_dir / f"{chapter_id}.sentences.json"
@@ -575,9 +331,17 @@ def convert_chapter(
         )
         return
 
-    # Check if any transcript files exist for this chapter
-    transcript_files = list(transcripts_dir.glob(f"audio-{chapter_num}-*.txt"))
-    if not transcript_files:
+    # Collect this chapter's transcript names once so the segment loop can
+    # test for a transcript without a stat call per segment
+    transcript_prefix = f"audio-{chapter_num}-"
+    with os.scandir(transcripts_dir) as entries:
+        transcript_names = {
+            entry.name
+            for entry in entries
+            if entry.name.startswith(transcript_prefix)
+            and entry.name.endswith(".txt")
+        }
+    if not transcript_names:
         print_warning(
             "No transcript files found",
             format_metadata_rows(
@@ -589,11 +353,6 @@ def convert_chapter(
         )
         return
 
-    # Find all segments for this chapter
-    segment_files = sorted(
-        [p for p in segments_dir.glob(f"{chapter_num}-*.txt")],
-        key=natural_segment_sort_key,
-    )
     if not segment_files:
         print_warning(
             "No segment files found",
@@ -606,15 +365,27 @@ def convert_chapter(
         )
         return
 
+    # Each canonical sentence is compared against the segment sentence that
+    # maps onto it and against the one before it (span check), so normalize
+    # every source once up front.
+    canonical_normalized_sources: List[str] = [
+        normalize_for_comparison(source) if isinstance(source, str) else ""
+        for source in (entry.get("source", "") for entry in chapter_sentences)
+    ]
+    # The span check compares them with spaces removed as well
+    canonical_compact_sources: List[str] = [
+        source.replace(" ", "") for source in canonical_normalized_sources
+    ]
+
     result: Dict[str, Dict[str, str]] = {}
     sent_index = 0  # index into chapter_sentences
 
     for seg_path in segment_files:
-        transcript_path = transcripts_dir / f"audio-{seg_path.stem}.txt"
+        transcript_name = f"audio-{seg_path.stem}.txt"
 
         # Always advance sentence index according to Chinese sentences in this segment,
         # even if transcript does not exist, to keep alignment.
-        seg_text = seg_path.read_text(encoding="utf-8").strip()
+        seg_text = seg_path.read_bytes().decode("utf-8").strip()
         cn_sentences = split_chinese_sentences(seg_text)
         if not cn_sentences:
             if seg_text:
@@ -623,7 +394,8 @@ def convert_chapter(
                 cn_sentences = []
 
         ipa_sentences: List[str] = []
-        if transcript_path.exists():
+        if transcript_name in transcript_names:
+            transcript_path = transcripts_dir / transcript_name
             ipa_text = transcript_path.read_text(encoding="utf-8").strip()
             ipa_sentences = split_ipa_sentences(ipa_text)
 
@@ -714,21 +486,7 @@ def convert_chapter(
             sent_id = s_entry.get("id")
             canonical_source = s_entry.get("source", "")
 
-            # Normalize for comparison: remove backticks and normalize whitespace
-            def normalize_for_comparison(text: str) -> str:
-                # Remove backticks (used in code sentences)
-                text = text.replace("`", "")
-                # Normalize whitespace
-                import re
-
-                text = re.sub(r"\s+", " ", text)
-                return text.strip()
-
-            canonical_normalized = (
-                normalize_for_comparison(canonical_source)
-                if isinstance(canonical_source, str)
-                else ""
-            )
+            canonical_normalized = canonical_normalized_sources[sent_index]
             cn_normalized = normalize_for_comparison(cn_sentence)
 
             # Check if segment sentence spans multiple canonical sentences
@@ -741,12 +499,11 @@ def convert_chapter(
             ):
                 # Check if there's a next canonical sentence that also fits in the segment sentence
                 if sent_index + 1 < len(chapter_sentences):
-                    next_canonical = chapter_sentences[sent_index + 1].get("source", "")
-                    next_normalized = normalize_for_comparison(next_canonical)
-                    if next_normalized:
+                    next_compact = canonical_compact_sources[sent_index + 1]
+                    if canonical_normalized_sources[sent_index + 1]:
                         # Check if segment sentence contains both canonical sentences
-                        combined = canonical_normalized + " " + next_normalized
-                        if combined.replace(" ", "") in cn_normalized.replace(" ", ""):
+                        combined = canonical_compact_sources[sent_index] + next_compact
+                        if combined in cn_normalized.replace(" ", ""):
                             spans_multiple = True
 
             if (
@@ -868,6 +625,21 @@ def convert_chapter(
     )
 
 
+# The Qieyun dictionary is the same for every chapter, so each worker process
+# receives it once through `_init_worker` instead of with every chapter task.
+_worker_dictionary: Dict[str, List[Tuple[str, int]]] = {}
+
+
+def _init_worker(dictionary: Dict[str, List[Tuple[str, int]]]) -> None:
+    global _worker_dictionary
+    _worker_dictionary = dictionary
+
+
+def _convert_chapter_in_worker(**kwargs: Any) -> None:
+    """Run `convert_chapter` with the dictionary installed by `_init_worker`."""
+    convert_chapter(dictionary=_worker_dictionary, **kwargs)
+
+
 def main() -> None:
     # This script lives in processor/migration/, repo root is two levels above
     # (__file__ -> migration -> processor -> project root)
@@ -896,17 +668,34 @@ def main() -> None:
         print(f"No chapter sentences files found in {sentences_dir}")
         return
 
+    # Scan the segments directory once; each chapter picks its own files
+    segment_files_by_chapter = group_segment_files(segments_dir)
+
     print("Converting segment transcripts to sentence-based transcripts...")
-    for chapter_id in chapter_ids:
-        print(f"- Chapter {chapter_id}:")
-        convert_chapter(
-            chapter_id=chapter_id,
-            sentences_dir=sentences_dir,
-            segments_dir=segments_dir,
-            transcripts_dir=transcripts_dir,
-            output_dir=output_dir,
-            dictionary=dictionary,
-        )
+    # Chapters are independent (separate inputs and output files), so convert
+    # them in parallel.
+    max_workers = min(os.cpu_count() or 1, len(chapter_ids))
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_init_worker, initargs=(dictionary,)
+    ) as executor:
+        futures = [
+            executor.submit(
+                run_logged,
+                _convert_chapter_in_worker,
+                f"- Chapter {chapter_id}:",
+                chapter_id=chapter_id,
+                sentences_dir=sentences_dir,
+                segments_dir=segments_dir,
+                transcripts_dir=transcripts_dir,
+                output_dir=output_dir,
+                # Only this chapter's files, e.g. "1-*.txt" for "c1"
+                segment_files=segment_files_by_chapter.get(chapter_id.lstrip("c"), []),
+            )
+            for chapter_id in chapter_ids
+        ]
+        for future in futures:
+            log, _ = future.result()
+            print(log, end="")
 
 
 if __name__ == "__main__":
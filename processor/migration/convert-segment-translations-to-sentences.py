@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union, cast
+from typing import Dict, List, Union, cast
 
 from processor.utils.cli_style import (
     INNER_DIVIDER,
@@ -10,88 +12,25 @@ from processor.utils.cli_style import (
     format_preview_entry,
     print_warning,
 )
-
-
-def split_chinese_sentences(text: str) -> List[str]:
-    """
-    Split Chinese text into sentences ending with '。'.
-
-    Mirrors the logic used in:
-      - processor/migration/convert-segment-transcripts-to-sentences.py
-      - processor/migration/generate_sentence_segments.py
-    so that segment-level sentence counts line up with canonical
-    `renderer/public/sentences/c*.sentences.json` files.
-    """
-    sentences: List[str] = []
-    current_sentence: List[str] = []
-    inside_quotes = False  # for 『 ... 』
-
-    i = 0
-    length = len(text)
-
-    while i < length:
-        char = text[i]
-
-        if char == "『":
-            inside_quotes = True
-            current_sentence.append(char)
-        elif char == "』":
-            inside_quotes = False
-            current_sentence.append(char)
-
-            # Check if previous character was sentence-ending punctuation
-            if i > 0:
-                prev_char = text[i - 1]
-                if prev_char in ("。", "！", "？"):
-                    # Only split at 。』 if NOT immediately followed by another
-                    # sentence-ending punctuation (e.g., don't split "。』。")
-                    next_char = text[i + 1] if i + 1 < length else None
-                    if next_char not in ("。", "！", "？"):
-                        processed = "".join(current_sentence).strip()
-                        if processed:
-                            sentences.append(processed)
-                        current_sentence = []
-        elif char == "」":
-            # Always include the closing quote
-            current_sentence.append(char)
-
-            # Look ahead for the next non-whitespace character.
-            # If it's 「曰」, we treat this as a sentence boundary so that
-            # patterns like `…耶」曰「…耶」` or `…耶」\n曰「…耶」` are split
-            # between `」` and `曰`.
-            j = i + 1
-            next_non_ws: str | None = None
-            while j < length:
-                lookahead = text[j]
-                if not lookahead.isspace():
-                    next_non_ws = lookahead
-                    break
-                j += 1
-
-            if next_non_ws == "曰":
-                processed = "".join(current_sentence).strip()
-                if processed:
-                    sentences.append(processed)
-                current_sentence = []
-        elif char in ("。", "！", "？") and not inside_quotes:
-            current_sentence.append(char)
-            processed = "".join(current_sentence).strip()
-            if processed:
-                sentences.append(processed)
-            current_sentence = []
-        else:
-            current_sentence.append(char)
-
-        i += 1
-
-    # Add any remaining text as the last sentence
-    processed = "".join(current_sentence).strip()
-    if processed:
-        sentences.append(processed)
-
-    # Keep all non-empty sentences, even if they do not literally end with
-    # '。', because some sentences end with closing quotes.
-    return [s for s in sentences if s]
+from processor.utils.parallel import run_logged
+
+try:  # Support both `-m processor.migration...` and direct script execution
+    from ._sentence_utils import (
+        group_segment_files,
+        load_chapter_sentences,
+        normalize_for_comparison,
+        split_chinese_sentences,
+    )
+except ImportError:
+    if __package__ in (None, "", "__main__"):
+        from _sentence_utils import (
+            group_segment_files,
+            load_chapter_sentences,
+            normalize_for_comparison,
+            split_chinese_sentences,
+        )
+    else:  # pragma: no cover - unexpected import failure
+        raise
 
 
 def split_english_sentences(translation: str) -> List[str]:
@@ -118,51 +57,23 @@ def split_english_sentences(translation: str) -> List[str]:
     return sentences
 
 
-def natural_segment_sort_key(path: Path) -> Tuple[int, int]:
-    """
-    Sort key for segment files like '1-2.txt' -> (1, 2).
-    """
-    name = path.stem  # "1-2"
-    parts = name.split("-")
-    if len(parts) != 2:
-        return (0, 0)
-    try:
-        return (int(parts[0]), int(parts[1]))
-    except ValueError:
-        return (0, 0)
-
-
-def load_chapter_sentences(sentences_path: Path) -> List[Dict[str, Any]]:
-    data = json.loads(sentences_path.read_text(encoding="utf-8"))
-    return list(data.get("sentences", []))
-
-
-def normalize_for_comparison(text: str) -> str:
-    """
-    Normalize Chinese sentences for comparison:
-      - remove backticks (inline code markers)
-      - collapse whitespace
-    """
-    # Remove backticks (used in code/inline sentences)
-    text = text.replace("`", "")
-
-    import re
-
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
-
-
 def convert_chapter(
     chapter_id: str,
     sentences_dir: Path,
     segments_dir: Path,
     translations_dir: Path,
     output_dir: Path,
+    segment_files: List[Path],
+    translation_files: List[Path],
 ) -> None:
     """
     Convert existing segment-based translations for one chapter into
     sentence-based translations.
 
+    `segment_files` and `translation_files` are the chapter's files from
+    `segments_dir` and `translations_dir`, in natural segment order (see
+    `group_segment_files`).
+
     This mirrors the control flow of convert-segment-transcripts-to-sentences.py
     but is much simpler (no IPA alignment or dictionary lookups).
     """
@@ -209,7 +120,6 @@ def convert_chapter(
         return
 
     # Check if any translation files exist for this chapter
-    translation_files = list(translations_dir.glob(f"{chapter_num}-*.txt"))
     if not translation_files:
         print_warning(
             "No translation files found",
@@ -222,11 +132,6 @@ def convert_chapter(
         )
         return
 
-    # Find all segments for this chapter
-    segment_files = sorted(
-        [p for p in segments_dir.glob(f"{chapter_num}-*.txt")],
-        key=natural_segment_sort_key,
-    )
     if not segment_files:
         print_warning(
             "No segments available",
@@ -239,15 +144,23 @@ def convert_chapter(
         )
         return
 
+    # Normalize every canonical source once rather than per segment sentence
+    canonical_normalized_sources: List[str] = [
+        normalize_for_comparison(source) if isinstance(source, str) else ""
+        for source in (entry.get("source", "") for entry in chapter_sentences)
+    ]
+
+    translation_names = {path.name for path in translation_files}
+
     result: Dict[str, Dict[str, str]] = {}
     sent_index = 0  # index into chapter_sentences
 
     for seg_path in segment_files:
-        translation_path = translations_dir / f"{seg_path.stem}.txt"
+        translation_name = f"{seg_path.stem}.txt"
 
         # Always advance sentence index according to Chinese sentences in this segment,
         # even if translation does not exist, to keep alignment.
-        seg_text = seg_path.read_text(encoding="utf-8").strip()
+        seg_text = seg_path.read_bytes().decode("utf-8").strip()
         cn_sentences = split_chinese_sentences(seg_text)
         if not cn_sentences:
             if seg_text:
@@ -256,7 +169,8 @@ def convert_chapter(
                 cn_sentences = []
 
         en_sentences: List[str] = []
-        if translation_path.exists():
+        if translation_name in translation_names:
+            translation_path = translations_dir / translation_name
             en_text = translation_path.read_text(encoding="utf-8").strip()
             en_sentences = split_english_sentences(en_text)
 
@@ -333,11 +247,7 @@ def convert_chapter(
             sent_id = s_entry.get("id")
             canonical_source = s_entry.get("source", "")
 
-            canonical_normalized = (
-                normalize_for_comparison(canonical_source)
-                if isinstance(canonical_source, str)
-                else ""
-            )
+            canonical_normalized = canonical_normalized_sources[sent_index]
             cn_normalized = normalize_for_comparison(cn_sentence)
 
             if (
@@ -430,16 +340,36 @@ def main() -> None:
         print(f"No chapter sentences files found in {sentences_dir}")
         return
 
+    # Scan each directory once instead of globbing it per chapter
+    segment_files_by_chapter = group_segment_files(segments_dir)
+    translation_files_by_chapter = group_segment_files(translations_dir)
+
     print("Converting segment translations to sentence-based translations...")
-    for chapter_id in chapter_ids:
-        print(f"- Chapter {chapter_id}:")
-        convert_chapter(
-            chapter_id=chapter_id,
-            sentences_dir=sentences_dir,
-            segments_dir=segments_dir,
-            translations_dir=translations_dir,
-            output_dir=output_dir,
-        )
+    # Chapters are independent (separate inputs and output files), so convert
+    # them in parallel.
+    max_workers = min(os.cpu_count() or 1, len(chapter_ids))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_logged,
+                convert_chapter,
+                f"- Chapter {chapter_id}:",
+                chapter_id=chapter_id,
+                sentences_dir=sentences_dir,
+                segments_dir=segments_dir,
+                translations_dir=translations_dir,
+                output_dir=output_dir,
+                # Only this chapter's files, e.g. "1-*.txt" for "c1"
+                segment_files=segment_files_by_chapter.get(chapter_id.lstrip("c"), []),
+                translation_files=translation_files_by_chapter.get(
+                    chapter_id.lstrip("c"), []
+                ),
+            )
+            for chapter_id in chapter_ids
+        ]
+        for future in futures:
+            log, _ = future.result()
+            print(log, end="")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List
 
 try:  # Support both `-m processor.migration...` and direct script execution
     from ..utils.cli_style import format_metadata_rows, print_warning
+    from ..utils.parallel import run_logged
+    from ._sentence_utils import (
+        group_segment_files,
+        load_chapter_sentences,
+        normalize_for_comparison,
+        split_chinese_sentences,
+    )
 except ImportError:
     if __package__ in (None, "", "__main__"):
         import sys
@@ -15,6 +24,13 @@ except ImportError:
         if str(package_root) not in sys.path:
             sys.path.insert(0, str(package_root))
         from utils.cli_style import format_metadata_rows, print_warning
+        from utils.parallel import run_logged
+        from _sentence_utils import (
+            group_segment_files,
+            load_chapter_sentences,
+            normalize_for_comparison,
+            split_chinese_sentences,
+        )
     else:  # pragma: no cover - unexpected import failure
         raise
 
@@ -47,126 +63,18 @@ Each JSON file contains:
 """
 
 
-def split_chinese_sentences(text: str) -> List[str]:
-    """
-    Split Chinese text into sentences ending with '。', with special
-    handling for quoted text and corner quotes, mirroring the logic
-    used in the migration script.
-    """
-    sentences: List[str] = []
-    current_sentence: List[str] = []
-    inside_quotes = False  # for 『 ... 』
-
-    i = 0
-    length = len(text)
-
-    while i < length:
-        char = text[i]
-
-        if char == "『":
-            inside_quotes = True
-            current_sentence.append(char)
-        elif char == "』":
-            inside_quotes = False
-            current_sentence.append(char)
-
-            # Check if previous character was sentence-ending punctuation
-            if i > 0:
-                prev_char = text[i - 1]
-                if prev_char in ("。", "！", "？"):
-                    # Only split at 。』 if NOT immediately followed by another
-                    # sentence-ending punctuation (e.g., don't split "。』。")
-                    next_char = text[i + 1] if i + 1 < length else None
-                    if next_char not in ("。", "！", "？"):
-                        processed = "".join(current_sentence).strip()
-                        if processed:
-                            sentences.append(processed)
-                        current_sentence = []
-        elif char == "」":
-            # Always include the closing quote
-            current_sentence.append(char)
-
-            # Look ahead for the next non-whitespace character.
-            # If it's 「曰」, we treat this as a sentence boundary so that
-            # patterns like `…耶」曰「…耶」` or `…耶」\n曰「…耶」` are split
-            # between `」` and `曰`.
-            j = i + 1
-            next_non_ws: str | None = None
-            while j < length:
-                lookahead = text[j]
-                if not lookahead.isspace():
-                    next_non_ws = lookahead
-                    break
-                j += 1
-
-            if next_non_ws == "曰":
-                processed = "".join(current_sentence).strip()
-                if processed:
-                    sentences.append(processed)
-                current_sentence = []
-        elif char in ("。", "！", "？") and not inside_quotes:
-            current_sentence.append(char)
-            processed = "".join(current_sentence).strip()
-            if processed:
-                sentences.append(processed)
-            current_sentence = []
-        else:
-            current_sentence.append(char)
-
-        i += 1
-
-    # Add any remaining text as the last sentence
-    processed = "".join(current_sentence).strip()
-    if processed:
-        sentences.append(processed)
-
-    # For our purposes we keep all non-empty sentences, even if they do not
-    # literally end with '。', because some sentences end with closing quotes.
-    return [s for s in sentences if s]
-
-
-def natural_segment_sort_key(path: Path) -> Tuple[int, int]:
-    """
-    Sort key for segment files like '1-2.txt' -> (1, 2).
-    """
-    name = path.stem  # "1-2"
-    parts = name.split("-")
-    if len(parts) != 2:
-        return (0, 0)
-    try:
-        return (int(parts[0]), int(parts[1]))
-    except ValueError:
-        return (0, 0)
-
-
-def load_chapter_sentences(sentences_path: Path) -> List[Dict[str, Any]]:
-    data = json.loads(sentences_path.read_text(encoding="utf-8"))
-    return list(data.get("sentences", []))
-
-
-def normalize_for_comparison(text: str) -> str:
-    """
-    Normalize Chinese sentences for comparison:
-      - remove backticks (inline code markers)
-      - collapse whitespace
-    """
-    # Remove backticks (used in code/inline sentences)
-    text = text.replace("`", "")
-
-    import re
-
-    text = re.sub(r"\s+", " ", text)
-    return text.strip()
-
-
 def build_sentence_segments_for_chapter(
     chapter_id: str,
     sentences_dir: Path,
     segments_dir: Path,
+    segment_files: List[Path],
 ) -> List[Dict[str, Any]]:
     """
     Compute the mapping from segment id (e.g. '1-17') to sentence ids
     (e.g. ['c1-s245', 'c1-s246']) for one chapter.
+
+    `segment_files` are the chapter's files from `segments_dir`, in natural
+    segment order (see `group_segment_files`).
     """
     sentences_path = sentences_dir / f"{chapter_id}.sentences.json"
     if not sentences_path.exists():
@@ -213,13 +121,8 @@ def build_sentence_segments_for_chapter(
     is_code_meta: Dict[str, Dict[str, Any]] = {}
     meta_path = segments_dir / f"{chapter_num}.json"
     if meta_path.exists():
-        is_code_meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        is_code_meta = json.loads(meta_path.read_bytes())
 
-    # Find all segments for this chapter
-    segment_files = sorted(
-        [p for p in segments_dir.glob(f"{chapter_num}-*.txt")],
-        key=natural_segment_sort_key,
-    )
     if not segment_files:
         print_warning(
             "No segment files found",
@@ -232,12 +135,24 @@ def build_sentence_segments_for_chapter(
         )
         return []
 
+    # Each canonical sentence is compared against the segment sentence that
+    # maps onto it and against the one before it (span check), so normalize
+    # every source once up front.
+    canonical_normalized_sources: List[str] = [
+        normalize_for_comparison(source) if isinstance(source, str) else ""
+        for source in (entry.get("source", "") for entry in chapter_sentences)
+    ]
+    # The span check compares them with spaces removed as well
+    canonical_compact_sources: List[str] = [
+        source.replace(" ", "") for source in canonical_normalized_sources
+    ]
+
     results: List[Dict[str, Any]] = []
     sent_index = 0  # index into chapter_sentences
 
     for seg_path in segment_files:
         seg_id = seg_path.stem  # e.g. "1-17"
-        seg_text = seg_path.read_text(encoding="utf-8").strip()
+        seg_text = seg_path.read_bytes().decode("utf-8").strip()
         cn_sentences = split_chinese_sentences(seg_text)
         if not cn_sentences:
             if seg_text:
@@ -272,13 +187,8 @@ def build_sentence_segments_for_chapter(
 
             s_entry = chapter_sentences[sent_index]
             sent_id = s_entry.get("id")
-            canonical_source = s_entry.get("source", "")
 
-            canonical_normalized = (
-                normalize_for_comparison(canonical_source)
-                if isinstance(canonical_source, str)
-                else ""
-            )
+            canonical_normalized = canonical_normalized_sources[sent_index]
             cn_normalized = normalize_for_comparison(cn_sentence)
 
             # Check if segment sentence spans multiple canonical sentences
@@ -292,11 +202,10 @@ def build_sentence_segments_for_chapter(
                 # Check if there's a next canonical sentence that also fits
                 # in the segment sentence
                 if sent_index + 1 < len(chapter_sentences):
-                    next_canonical = chapter_sentences[sent_index + 1].get("source", "")
-                    next_normalized = normalize_for_comparison(next_canonical)
-                    if next_normalized:
-                        combined = canonical_normalized + " " + next_normalized
-                        if combined.replace(" ", "") in cn_normalized.replace(" ", ""):
+                    next_compact = canonical_compact_sources[sent_index + 1]
+                    if canonical_normalized_sources[sent_index + 1]:
+                        combined = canonical_compact_sources[sent_index] + next_compact
+                        if combined in cn_normalized.replace(" ", ""):
                             spans_multiple = True
 
             if spans_multiple:
@@ -385,14 +294,36 @@ def generate_sentence_segments_json(root: Path) -> None:
 
     total_segments = 0
 
+    # Derive chapter ids like "c1" from "c1.sentences"
+    chapter_ids = [p.stem.split(".")[0] for p in chapter_files]
+
+    # Scan the segments directory once instead of globbing it per chapter
+    segment_files_by_chapter = group_segment_files(segments_dir)
+
     print("Building sentence segments from existing segments and sentences...")
-    for sentences_path in chapter_files:
-        # Derive chapter id like "c1" from "c1.sentences"
-        chapter_id = sentences_path.stem.split(".")[0]
-        print(f"- Chapter {chapter_id}")
-        chapter_segments = build_sentence_segments_for_chapter(
-            chapter_id, sentences_dir, segments_dir
-        )
+    # Chapters are built independently, so build them in parallel and write
+    # the results in chapter order.
+    max_workers = min(os.cpu_count() or 1, len(chapter_ids))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(
+                run_logged,
+                build_sentence_segments_for_chapter,
+                f"- Chapter {chapter_id}",
+                chapter_id=chapter_id,
+                sentences_dir=sentences_dir,
+                segments_dir=segments_dir,
+                # Only this chapter's files, e.g. "1-*.txt" for "c1"
+                segment_files=segment_files_by_chapter.get(chapter_id.lstrip("c"), []),
+            )
+            for chapter_id in chapter_ids
+        ]
+        built = [future.result() for future in futures]
+
+    for sentences_path, chapter_id, (log, chapter_segments) in zip(
+        chapter_files, chapter_ids, built
+    ):
+        print(log, end="")
         if not chapter_segments:
             print_warning(
                 "No sentence segments generated",
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional, Literal, Dict, Any
 
@@ -9,7 +9,7 @@ from typing import List, Optional, Literal, Dict, Any
 BlockType = Literal["text", "list", "code"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Block:
     id: str
     type: BlockType
@@ -17,6 +17,16 @@ class Block:
     items: Optional[List[str]] = None  # for list blocks
 
 
+def _block_to_dict(block: Block) -> Dict[str, Any]:
+    """Same shape as `asdict(block)`, without its per-field deep copy."""
+    return {
+        "id": block.id,
+        "type": block.type,
+        "source": block.source,
+        "items": block.items,
+    }
+
+
 # Hardcoded English titles for now; extend as needed.
 CHAPTER_TITLE_EN: Dict[int, str] = {
     1: "Clarify Meaning",
@@ -201,7 +211,7 @@ def parse_chapter(path: Path) -> Dict[str, Any]:
         "number": chapter_num,
         "title": title,
         "title_en": CHAPTER_TITLE_EN.get(chapter_num),
-        "blocks": [asdict(b) for b in blocks],
+        "blocks": [_block_to_dict(b) for b in blocks],
     }
     return data
 
@@ -10,6 +10,10 @@ from typing import Any
 
 from utils.cli_style import format_metadata_rows, print_warning
 
+_RE_NON_SPACE = re.compile(r"\S")
+_RE_DOUBLE_BRACKETS = re.compile(r"「「|」」")
+_DOUBLE_BRACKETS = {"「「": "『", "」」": "』"}
+
 
 @dataclass
 class RawSegment:
@@ -52,8 +56,7 @@ def visible_length(text: str) -> int:
 
 
 def remove_markdown(text: str, preserve_newlines: bool = False) -> str:
-    text = text.replace("「「", "『")
-    text = text.replace("」」", "』")
+    text = _RE_DOUBLE_BRACKETS.sub(lambda m: _DOUBLE_BRACKETS[m.group()], text)
 
     text = re.sub(r"^#+\s+.*$", "", text, flags=re.MULTILINE)
     text = re.sub(r"^-\s+", "", text, flags=re.MULTILINE)
@@ -67,17 +70,10 @@ def remove_markdown(text: str, preserve_newlines: bool = False) -> str:
 
 
 def split_sentences(text: str) -> list[str]:
-    sentences: list[str] = []
-    parts = text.split("。")
-
-    for i, part in enumerate(parts):
-        part = part.strip()
-        if not part:
-            continue
-        if i < len(parts) - 1 or text.endswith("。"):
-            sentences.append(part + "。")
-
-    return [s for s in sentences if s.endswith("。")]
+    # Text after the last "。" is never a complete sentence (and is empty when
+    # the text ends with "。"), so only the pieces before it are kept
+    parts = text.split("。")[:-1]
+    return [part + "。" for part in map(str.strip, parts) if part]
 
 
 def create_segments(
@@ -239,73 +235,43 @@ def segment_chapter(chapter_path: Path) -> ChapterSegments:
 
 def split_chinese_sentences(text: str) -> list[str]:
     sentences: list[str] = []
-    current_sentence: list[str] = []
+    start = 0  # index where the current sentence begins
     inside_quotes = False
 
-    i = 0
     length = len(text)
 
-    while i < length:
-        char = text[i]
+    def flush(end: int) -> None:
+        nonlocal start
+        processed = text[start:end].strip()
+        if processed:
+            sentences.append(processed)
+        start = end
 
+    for i, char in enumerate(text):
         if char == "『":
             inside_quotes = True
-            current_sentence.append(char)
         elif char == "』":
             inside_quotes = False
-            current_sentence.append(char)
             if i > 0:
                 prev_char = text[i - 1]
                 if prev_char in ("。", "！", "？"):
                     next_char = text[i + 1] if i + 1 < length else None
                     if next_char not in ("。", "！", "？"):
-                        processed = "".join(current_sentence).strip()
-                        if processed:
-                            sentences.append(processed)
-                        current_sentence = []
+                        flush(i + 1)
         elif char == "」":
-            current_sentence.append(char)
-            j = i + 1
-            next_non_ws = None
-            while j < length:
-                lookahead = text[j]
-                if not lookahead.isspace():
-                    next_non_ws = lookahead
-                    break
-                j += 1
-            if next_non_ws == "曰":
-                processed = "".join(current_sentence).strip()
-                if processed:
-                    sentences.append(processed)
-                current_sentence = []
+            # Find the next non-whitespace character in one C-level scan.
+            lookahead = _RE_NON_SPACE.search(text, i + 1)
+            if lookahead is not None and lookahead.group() == "曰":
+                flush(i + 1)
         elif char == "\n" and not inside_quotes:
-            # Treat consecutive newlines as a single delimiter.
-            # Collect all consecutive newlines.
-            newlines = [char]
-            j = i + 1
-            while j < length and text[j] == "\n":
-                newlines.append(text[j])
-                j += 1
-            
-            processed = "".join(current_sentence).strip()
-            if processed:
-                sentences.append(processed)
-            current_sentence = newlines
-            i = j - 1  # Will be incremented at end of loop
+            # Treat consecutive newlines as a single delimiter: the first one
+            # ends the sentence and the rest only start an empty one, which
+            # is stripped away.
+            flush(i)
         elif char in ("。", "！", "？") and not inside_quotes:
-            current_sentence.append(char)
-            processed = "".join(current_sentence).strip()
-            if processed:
-                sentences.append(processed)
-            current_sentence = []
-        else:
-            current_sentence.append(char)
-
-        i += 1
+            flush(i + 1)
 
-    processed = "".join(current_sentence).strip()
-    if processed:
-        sentences.append(processed)
+    flush(length)
 
     return [s for s in sentences if s]
 
@@ -189,39 +189,35 @@ def load_special_cases_config() -> tuple[dict[str, int], dict[str, dict[str, int
     return merged_char, merged_phrase, merged_replace
 
 
-@lru_cache(maxsize=None)
-def _lookup_meaning_cached(
-    char: str, readings_key: tuple[str, ...]
-) -> list[dict[str, str]]:
-    if not char:
-        return []
-    if not LOOKUP_SCRIPT_EXISTS:
-        print(
-            f"Warning: Local definition helper not found at {LOOKUP_SCRIPT}. "
-            "Definitions will be omitted."
-        )
-        return []
-    if BUN_EXECUTABLE is None:
-        print(
-            "Error: Bun executable not found in $BUN_INSTALL, $BUN_PATH, or PATH. "
-            "Unable to load local definitions."
-        )
-        return []
-
-    readings_list: list[dict[str, str] | str] = []
-    for r in readings_key:
-        if isinstance(r, str):
-            tupa = convert_cinix_to_tupa(r)
-            readings_list.append({"original": r, "tupa": tupa})
-        else:
-            readings_list.append(str(r))
-
-    payload = {"entries": [{"char": char, "readings": readings_list}]}
+# Local lookup results keyed by (char, readings). `prefetch_meanings` fills it
+# in bulk so a whole sentence file costs a single Bun process.
+_LOCAL_MEANINGS: dict[tuple[str, tuple[str, ...]], list[dict[str, str]]] = {}
+
+
+def _run_meaning_lookup(
+    keys: list[tuple[str, tuple[str, ...]]],
+) -> dict[str, Any] | None:
+    """
+    Run the local helper once for `keys`, which must hold at most one key per
+    character since the helper answers by character. Returns the response, or
+    None after reporting a failed run.
+    """
+    entries: list[dict[str, Any]] = []
+    for char, readings_key in keys:
+        readings_list: list[dict[str, str] | str] = []
+        for r in readings_key:
+            if isinstance(r, str):
+                tupa = convert_cinix_to_tupa(r)
+                readings_list.append({"original": r, "tupa": tupa})
+            else:
+                readings_list.append(str(r))
+        entries.append({"char": char, "readings": readings_list})
 
+    chars = "".join(char for char, _ in keys)
     try:
         completed = subprocess.run(
             [str(BUN_EXECUTABLE), "run", str(LOOKUP_SCRIPT)],
-            input=json.dumps(payload),
+            input=json.dumps({"entries": entries}),
             capture_output=True,
             text=True,
             cwd=str(LOOKUP_SCRIPT.parent),
@@ -229,21 +225,86 @@ def _lookup_meaning_cached(
         )
     except FileNotFoundError:
         print("Error: Bun executable became unavailable while invoking lookup helper.")
-        return []
+        return None
     except subprocess.CalledProcessError as exc:
         stderr = (exc.stderr or "").strip()
         print(
-            f"Warning: Local definition lookup failed for '{char}': " f"{stderr or exc}"
+            f"Warning: Local definition lookup failed for '{chars}': " f"{stderr or exc}"
         )
-        return []
+        return None
     else:
         try:
-            data = json.loads(completed.stdout or "{}")
+            return json.loads(completed.stdout or "{}")
         except json.JSONDecodeError as exc:
-            print(f"Warning: Invalid JSON from local definition lookup for '{char}': {exc}")
-            return []
-        results = data.get(char)
-        return results if isinstance(results, list) else []
+            print(f"Warning: Invalid JSON from local definition lookup for '{chars}': {exc}")
+            return None
+
+
+def prefetch_meanings(keys: list[tuple[str, tuple[str, ...]]]) -> None:
+    pending = list(
+        dict.fromkeys(
+            key for key in keys if key[0] and key not in _LOCAL_MEANINGS
+        )
+    )
+    # A missing helper or Bun is reported by the per-key lookup instead.
+    if not pending or not LOOKUP_SCRIPT_EXISTS or BUN_EXECUTABLE is None:
+        return
+
+    # The helper answers by character, so a run can only carry one readings
+    # tuple per character; further tuples for the same character go into
+    # later runs.
+    keys_by_char: dict[str, list[tuple[str, tuple[str, ...]]]] = {}
+    for key in pending:
+        keys_by_char.setdefault(key[0], []).append(key)
+
+    while keys_by_char:
+        batch = [char_keys.pop(0) for char_keys in keys_by_char.values()]
+        keys_by_char = {
+            char: char_keys for char, char_keys in keys_by_char.items() if char_keys
+        }
+
+        data = _run_meaning_lookup(batch)
+        if data is None:
+            # Leave the batch uncached so each character is retried on its
+            # own and a failure only affects that character.
+            print(
+                f"Warning: Batched definition lookup failed for {len(batch)} "
+                "characters; retrying them one at a time."
+            )
+            continue
+        for key in batch:
+            results = data.get(key[0])
+            _LOCAL_MEANINGS[key] = results if isinstance(results, list) else []
+
+
+def _lookup_meaning_cached(
+    char: str, readings_key: tuple[str, ...]
+) -> list[dict[str, str]]:
+    if not char:
+        return []
+    key = (char, readings_key)
+    if key in _LOCAL_MEANINGS:
+        return _LOCAL_MEANINGS[key]
+
+    results: list[dict[str, str]] = []
+    if not LOOKUP_SCRIPT_EXISTS:
+        print(
+            f"Warning: Local definition helper not found at {LOOKUP_SCRIPT}. "
+            "Definitions will be omitted."
+        )
+    elif BUN_EXECUTABLE is None:
+        print(
+            "Error: Bun executable not found in $BUN_INSTALL, $BUN_PATH, or PATH. "
+            "Unable to load local definitions."
+        )
+    else:
+        data = _run_meaning_lookup([key])
+        if data is not None:
+            found = data.get(char)
+            if isinstance(found, list):
+                results = found
+    _LOCAL_MEANINGS[key] = results
+    return results
 
 
 @lru_cache(maxsize=None)
@@ -557,6 +618,24 @@ def transcribe_sentence_files(
             entry.get("id"): idx for idx, entry in enumerate(canon_sentences)
         }
 
+        # Look up meanings for every multi-reading character still to be
+        # transcribed in this file with a single helper run.
+        lookup_keys: list[tuple[str, tuple[str, ...]]] = []
+        for entry in data.values():
+            if not isinstance(entry, dict):
+                continue
+            source = entry.get("source", "")
+            if not isinstance(source, str) or not source.strip():
+                continue
+            existing_ipa = entry.get("ipa")
+            if isinstance(existing_ipa, str) and existing_ipa.strip():
+                continue
+            for ch in normalize_text(replace_chars(source)):
+                readings = dictionary.get(ch)
+                if readings and len(readings) > 1:
+                    lookup_keys.append((ch, tuple(trans for trans, _ in readings)))
+        prefetch_meanings(lookup_keys)
+
         try:
             logged_skip_after_change = False
             for sent_id, entry in data.items():
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import contextlib
+import io
+import sys
+from typing import Any, Callable, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+def run_logged(fn: Callable[..., T], header: str, **kwargs: Any) -> Tuple[str, T]:
+    """
+    Call `fn(**kwargs)` with stdout captured and return `(log, result)`.
+
+    Meant for per-chapter work in a process pool: the caller prints each
+    returned log in chapter order to keep output readable. `header` is
+    printed first so every log starts with its chapter line.
+
+    If `fn` raises, the output captured so far is written to the real stdout
+    before the exception propagates, so the failing chapter's log is not lost.
+    """
+    log = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(log):
+            print(header)
+            result = fn(**kwargs)
+    except BaseException:
+        sys.stdout.write(log.getvalue())
+        sys.stdout.flush()
+        raise
+    return log.getvalue(), result
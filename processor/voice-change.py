@@ -23,7 +23,7 @@ def _():
     client = ElevenLabs(api_key=ELEVENLABS_API_KEY)
 
     AUDIO_DIR = Path("../renderer/public/audios/")
-    return AUDIO_DIR, client
+    return AUDIO_DIR, client, os
 
 
 @app.cell
@@ -61,9 +61,21 @@ def _(
     VOICE_ID,
     client,
     female_dir,
+    os,
     voice_settings,
 ):
-    from io import BytesIO
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Requests are network-bound and independent, so overlap them with threads.
+    # The ElevenLabs client is shared across workers to reuse its HTTPS session.
+    FEMALIZE_WORKERS = int(os.getenv("FEMALIZE_WORKERS", "4"))
+
+    print_lock = threading.Lock()
+
+    def log(message):
+        with print_lock:
+            print(message)
 
     # Sort audio files naturally by chapter and segment, e.g. "audio-1-2.mp3"
     def sort_key(path):
@@ -72,40 +84,59 @@ def _(
         parts = name.split("-")  # ["audio", "1", "2"]
         return (int(parts[1]), int(parts[2]))  # (chapter, segment)
 
+    def female_path(path):
+        return female_dir / f"{path.stem}-f.mp3"
+
+    def femalize_one(file):
+        female_file = female_path(file)
+        log(f"Generating {female_file} from {file}...")
+
+        # Stream chunks to a temporary file and move it into place on success,
+        # so a partial download never looks like a finished one
+        tmp_file = female_file.with_suffix(".mp3.tmp")
+
+        # Perform speech-to-speech conversion, letting the SDK upload
+        # straight from the open file instead of an in-memory copy
+        try:
+            with open(file, "rb") as audio_data:
+                audio_stream = client.speech_to_speech.convert(
+                    voice_id=VOICE_ID,
+                    audio=audio_data,
+                    model_id=MODEL_ID,
+                    output_format=OUTPUT_FORMAT,
+                    voice_settings=voice_settings,
+                )
+
+                with open(tmp_file, "wb") as output_file:
+                    for chunk in audio_stream:
+                        if chunk:
+                            output_file.write(chunk)
+            os.replace(tmp_file, female_file)
+            log(f"✓ Successfully generated {female_file}")
+            return file, True, None
+        except Exception as e:
+            log(f"✗ Error processing {file}: {e}")
+            return file, False, e
+        finally:
+            # Drop the partial output of a failed or interrupted conversion
+            tmp_file.unlink(missing_ok=True)
+
     # Collect and sort files matching audio-*-*.mp3
     audio_files = sorted(AUDIO_DIR.glob("audio-*-*.mp3"), key=sort_key)
 
     print(f"Found {len(audio_files)} audio files to process")
 
-    for file in audio_files:
-        female_file = female_dir / f"{file.stem}-f.mp3"
-        if female_file.exists():
-            continue
-        print(f"Generating {female_file} from {file}...")
+    # Skip existing outputs up front so no worker slot is spent on them
+    pending_files = [f for f in audio_files if not female_path(f).exists()]
 
-        # Read input audio file and convert to BytesIO
-        with open(file, "rb") as audio_file:
-            audio_data = BytesIO(audio_file.read())
+    with ThreadPoolExecutor(max_workers=FEMALIZE_WORKERS) as executor:
+        results = list(executor.map(femalize_one, pending_files))
 
-        # Perform speech-to-speech conversion
-        try:
-            audio_stream = client.speech_to_speech.convert(
-                voice_id=VOICE_ID,
-                audio=audio_data,
-                model_id=MODEL_ID,
-                output_format=OUTPUT_FORMAT,
-                voice_settings=voice_settings,
-            )
-
-            # Convert generator to bytes
-            audio_bytes = b"".join(audio_stream)
-
-            # Save the converted audio
-            with open(female_file, "wb") as output_file:
-                output_file.write(audio_bytes)
-            print(f"✓ Successfully generated {female_file}")
-        except Exception as e:
-            print(f"✗ Error processing {file}: {e}")
+    failed = [file for file, ok, _ in results if not ok]
+    print(
+        f"Processed {len(results)} files with {FEMALIZE_WORKERS} workers "
+        f"({len(failed)} failed)"
+    )
     return
 
 